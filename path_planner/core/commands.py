@@ -4,11 +4,17 @@ Command system for mechanism actions.
 Commands are loaded from JSON files in command_library/ and seasons/.
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import Optional
 
 
-@dataclass
+# Matches "{name}" parameter placeholders in code templates (any name
+# without braces, e.g. "{arm.pos}")
+_PLACEHOLDER = re.compile(r"\{([^{}]+)\}")
+
+
+@dataclass(slots=True)
 class CommandParameter:
     """A parameter for a command (e.g., velocity, duration)."""
     name: str
@@ -19,7 +25,7 @@ class CommandParameter:
     description: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Command:
     """A single command that can be assigned to a waypoint."""
     id: str                # Unique identifier (e.g., "intake_in")
@@ -30,6 +36,10 @@ class Command:
     description: str = ""
     parameters: list[CommandParameter] = field(default_factory=list)
     
+    # code_template split on placeholders, and the template it was split from
+    _template_parts: list[str] = field(default_factory=list, init=False, repr=False, compare=False)
+    _parsed_template: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
     def generate_code(self, param_values: Optional[dict] = None) -> str:
         """
         Generate C++ code with parameters filled in.
@@ -40,40 +50,84 @@ class Command:
         Returns:
             C++ code string
         """
-        code = self.code_template
+        if not param_values:
+            return self.code_template
+        
+        # Split once per template; odd entries are placeholder names
+        if self._parsed_template is not self.code_template:
+            self._template_parts = _PLACEHOLDER.split(self.code_template)
+            self._parsed_template = self.code_template
+        
+        parts = self._template_parts.copy()
+        for i in range(1, len(parts), 2):
+            name = parts[i]
+            if name in param_values:
+                parts[i] = str(param_values[name])
+            else:
+                parts[i] = f"{{{name}}}"
         
-        if param_values:
-            for name, value in param_values.items():
-                code = code.replace(f"{{{name}}}", str(value))
+        return "".join(parts)
+    
+    def reset_from_dict(self, data: dict, category: Optional[str] = None) -> None:
+        """
+        Overwrite all fields in place from a dictionary (see from_dict).
         
-        return code
+        Args:
+            data: Command dictionary
+            category: Category to use instead of data's "category"
+        """
+        self.id = data["id"]
+        self.name = data["name"]
+        self.code_template = data["code_template"]
+        self.color = data.get("color", "#FFFFFF")
+        self.category = data.get("category", "Misc") if category is None else category
+        self.description = data.get("description", "")
+        self.parameters = _parameters_from_dicts(data.get("parameters", []))
     
     @classmethod
     def from_dict(cls, data: dict) -> "Command":
         """Create from dictionary."""
-        params = []
-        for p in data.get("parameters", []):
-            params.append(CommandParameter(
-                name=p["name"],
-                type=p.get("type", "int"),
-                default=p.get("default", 0),
-                min_val=p.get("min"),
-                max_val=p.get("max"),
-                description=p.get("description", "")
-            ))
+        return cls.from_dict_with_category(data, data.get("category", "Misc"))
+    
+    @classmethod
+    def from_dict_with_category(cls, data: dict, category: str) -> "Command":
+        """
+        Create from dictionary with the given category.
         
+        Args:
+            data: Command dictionary (not modified)
+            category: Category for the command, overriding data's
+        
+        Returns:
+            New Command
+        """
         return cls(
             id=data["id"],
             name=data["name"],
             code_template=data["code_template"],
             color=data.get("color", "#FFFFFF"),
-            category=data.get("category", "Misc"),
+            category=category,
             description=data.get("description", ""),
-            parameters=params
+            parameters=_parameters_from_dicts(data.get("parameters", []))
+        )
+
+
+def _parameters_from_dicts(params: list[dict]) -> list[CommandParameter]:
+    """Create command parameters from their dictionaries."""
+    return [
+        CommandParameter(
+            name=p["name"],
+            type=p.get("type", "int"),
+            default=p.get("default", 0),
+            min_val=p.get("min"),
+            max_val=p.get("max"),
+            description=p.get("description", "")
         )
+        for p in params
+    ]
 
 
-@dataclass
+@dataclass(slots=True)
 class CommandSequence:
     """A sequence of commands that run together."""
     id: str
@@ -34,6 +34,23 @@ class CoordinateSystem:
         """
         self.canvas_size = canvas_size
         self.scale = canvas_size / FIELD_SIZE_INCHES  # pixels per inch
+        self._inv_scale = FIELD_SIZE_INCHES / canvas_size  # inches per pixel
+        
+        # Per-point conversions specialized for this canvas size. The
+        # constants are bound as defaults (fast locals instead of attribute
+        # lookups); these shadow the methods below, which document them.
+        def field_to_canvas(field_x: float, field_y: float,
+                            scale: float = self.scale,
+                            half: float = FIELD_HALF_SIZE) -> tuple[float, float]:
+            return ((field_x + half) * scale, (half - field_y) * scale)
+        
+        def canvas_to_field(canvas_x: float, canvas_y: float,
+                            inv_scale: float = self._inv_scale,
+                            half: float = FIELD_HALF_SIZE) -> tuple[float, float]:
+            return ((canvas_x * inv_scale) - half, half - (canvas_y * inv_scale))
+        
+        self.field_to_canvas = field_to_canvas
+        self.canvas_to_field = canvas_to_field
     
     def field_to_canvas(self, field_x: float, field_y: float) -> tuple[float, float]:
         """
@@ -50,6 +67,27 @@ class CoordinateSystem:
         canvas_y = (FIELD_HALF_SIZE - field_y) * self.scale  # Flip Y
         return (canvas_x, canvas_y)
     
+    def field_to_canvas_batch(
+        self,
+        field_xs: list[float],
+        field_ys: list[float]
+    ) -> tuple[list[float], list[float]]:
+        """
+        Convert many field coordinates to canvas coordinates at once.
+        
+        Args:
+            field_xs: X values in inches
+            field_ys: Y values in inches
+        
+        Returns:
+            (canvas_xs, canvas_ys) lists in pixels
+        """
+        scale = self.scale
+        offset = FIELD_HALF_SIZE * scale
+        canvas_xs = [offset + x * scale for x in field_xs]
+        canvas_ys = [offset - y * scale for y in field_ys]  # Flip Y
+        return (canvas_xs, canvas_ys)
+    
     def canvas_to_field(self, canvas_x: float, canvas_y: float) -> tuple[float, float]:
         """
         Convert canvas coordinates (pixels) to field coordinates (inches).
@@ -61,8 +99,8 @@ class CoordinateSystem:
         Returns:
             (field_x, field_y) in inches
         """
-        field_x = (canvas_x / self.scale) - FIELD_HALF_SIZE
-        field_y = FIELD_HALF_SIZE - (canvas_y / self.scale)  # Flip Y back
+        field_x = (canvas_x * self._inv_scale) - FIELD_HALF_SIZE
+        field_y = FIELD_HALF_SIZE - (canvas_y * self._inv_scale)  # Flip Y back
         return (field_x, field_y)
 
 
@@ -78,14 +116,27 @@ def calculate_heading(from_x: float, from_y: float, to_x: float, to_y: float) ->
     Returns:
         Heading in degrees (0 to 360)
     """
-    dx = to_x - from_x
-    dy = to_y - from_y
-    angle = math.degrees(math.atan2(dx, dy))
+    return calculate_headings([from_x, to_x], [from_y, to_y])[0]
+
+
+def calculate_headings(xs: list[float], ys: list[float]) -> list[float]:
+    """
+    Calculate headings between each pair of consecutive points.
     
-    if angle < 0:
-        angle += 360
+    Args:
+        xs: X coordinates in inches
+        ys: Y coordinates in inches
     
-    return angle
+    Returns:
+        List of len(xs) - 1 headings in degrees (0 to 360), where entry i
+        is the heading from point i to point i + 1
+    """
+    atan2 = math.atan2
+    degrees = math.degrees
+    return [
+        degrees(atan2(x1 - x0, y1 - y0)) % 360.0
+        for x0, y0, x1, y1 in zip(xs, ys, xs[1:], ys[1:])
+    ]
 
 
 def calculate_distance(x1: float, y1: float, x2: float, y2: float) -> float:
@@ -5,11 +5,13 @@ Includes Bezier curve calculations and path decomposition.
 """
 
 import math
+from bisect import bisect_left
 from dataclasses import dataclass
-from typing import Optional
+from itertools import accumulate
+from typing import NamedTuple, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class Point:
     """A simple 2D point."""
     x: float
@@ -32,6 +34,16 @@ class Point:
         return self.__mul__(scalar)
 
 
+class PointArray(NamedTuple):
+    """Parallel x/y coordinate lists for a run of points."""
+    xs: list[float]
+    ys: list[float]
+    
+    def to_points(self) -> list[Point]:
+        """Convert to a list of Point objects."""
+        return [Point(x, y) for x, y in zip(self.xs, self.ys)]
+
+
 def lerp(a: float, b: float, t: float) -> float:
     """Linear interpolation between two values."""
     return a + (b - a) * t
@@ -57,9 +69,11 @@ def quadratic_bezier(p0: Point, p1: Point, p2: Point, t: float) -> Point:
     """
     # B(t) = (1-t)²P0 + 2(1-t)tP1 + t²P2
     one_minus_t = 1 - t
-    return (one_minus_t * one_minus_t * p0 + 
-            2 * one_minus_t * t * p1 + 
-            t * t * p2)
+    a = one_minus_t * one_minus_t
+    b = 2 * one_minus_t * t
+    c = t * t
+    return Point(a * p0.x + b * p1.x + c * p2.x,
+                 a * p0.y + b * p1.y + c * p2.y)
 
 
 def cubic_bezier(p0: Point, p1: Point, p2: Point, p3: Point, t: float) -> Point:
@@ -78,10 +92,50 @@ def cubic_bezier(p0: Point, p1: Point, p2: Point, p3: Point, t: float) -> Point:
     """
     # B(t) = (1-t)³P0 + 3(1-t)²tP1 + 3(1-t)t²P2 + t³P3
     one_minus_t = 1 - t
-    return (one_minus_t**3 * p0 + 
-            3 * one_minus_t**2 * t * p1 + 
-            3 * one_minus_t * t**2 * p2 + 
-            t**3 * p3)
+    a = one_minus_t * one_minus_t * one_minus_t
+    b = 3 * one_minus_t * one_minus_t * t
+    c = 3 * one_minus_t * t * t
+    d = t * t * t
+    return Point(a * p0.x + b * p1.x + c * p2.x + d * p3.x,
+                 a * p0.y + b * p1.y + c * p2.y + d * p3.y)
+
+
+def decompose_quadratic_bezier_xy(
+    p0: Point,
+    p1: Point,
+    p2: Point,
+    num_segments: int = 5
+) -> PointArray:
+    """
+    Decompose a quadratic Bezier curve into parallel x/y coordinate lists.
+    
+    Evaluates the polynomial on plain floats so no intermediate Point
+    objects are created per sample.
+    
+    Args:
+        p0: Start point
+        p1: Control point
+        p2: End point
+        num_segments: Number of segments to create
+    
+    Returns:
+        PointArray of coordinates (including start and end)
+    """
+    x0, y0 = p0.x, p0.y
+    x1, y1 = p1.x, p1.y
+    x2, y2 = p2.x, p2.y
+    
+    xs = []
+    ys = []
+    for i in range(num_segments + 1):
+        t = i / num_segments
+        u = 1 - t
+        a = u * u
+        b = 2 * u * t
+        c = t * t
+        xs.append(a * x0 + b * x1 + c * x2)
+        ys.append(a * y0 + b * y1 + c * y2)
+    return PointArray(xs, ys)
 
 
 def decompose_quadratic_bezier(
@@ -102,11 +156,46 @@ def decompose_quadratic_bezier(
     Returns:
         List of points (including start and end)
     """
-    points = []
+    return decompose_quadratic_bezier_xy(p0, p1, p2, num_segments).to_points()
+
+
+def decompose_cubic_bezier_xy(
+    p0: Point,
+    p1: Point,
+    p2: Point,
+    p3: Point,
+    num_segments: int = 5
+) -> PointArray:
+    """
+    Decompose a cubic Bezier curve into parallel x/y coordinate lists.
+    
+    Args:
+        p0: Start point
+        p1: First control point
+        p2: Second control point
+        p3: End point
+        num_segments: Number of segments to create
+    
+    Returns:
+        PointArray of coordinates (including start and end)
+    """
+    x0, y0 = p0.x, p0.y
+    x1, y1 = p1.x, p1.y
+    x2, y2 = p2.x, p2.y
+    x3, y3 = p3.x, p3.y
+    
+    xs = []
+    ys = []
     for i in range(num_segments + 1):
         t = i / num_segments
-        points.append(quadratic_bezier(p0, p1, p2, t))
-    return points
+        u = 1 - t
+        a = u * u * u
+        b = 3 * u * u * t
+        c = 3 * u * t * t
+        d = t * t * t
+        xs.append(a * x0 + b * x1 + c * x2 + d * x3)
+        ys.append(a * y0 + b * y1 + c * y2 + d * y3)
+    return PointArray(xs, ys)
 
 
 def decompose_cubic_bezier(
@@ -129,11 +218,7 @@ def decompose_cubic_bezier(
     Returns:
         List of points (including start and end)
     """
-    points = []
-    for i in range(num_segments + 1):
-        t = i / num_segments
-        points.append(cubic_bezier(p0, p1, p2, p3, t))
-    return points
+    return decompose_cubic_bezier_xy(p0, p1, p2, p3, num_segments).to_points()
 
 
 def estimate_curve_length(points: list[Point]) -> float:
@@ -141,44 +226,179 @@ def estimate_curve_length(points: list[Point]) -> float:
     if len(points) < 2:
         return 0.0
     
-    total = 0.0
-    for i in range(len(points) - 1):
-        total += points[i].distance_to(points[i + 1])
-    return total
+    return estimate_curve_length_xy(
+        PointArray([p.x for p in points], [p.y for p in points])
+    )
+
+
+def estimate_curve_length_xy(points: PointArray) -> float:
+    """Estimate the length of a path through parallel x/y coordinates."""
+    return curve_lengths(points)[-1] if len(points.xs) >= 2 else 0.0
+
+
+def curve_lengths(points: PointArray) -> list[float]:
+    """
+    Calculate cumulative arc length at each point of a polyline.
+    
+    Args:
+        points: Polyline as parallel x/y coordinates
+    
+    Returns:
+        List with one entry per point, starting at 0.0 (empty if there
+        are no points)
+    """
+    xs, ys = points
+    if not xs:
+        return []
+    hypot = math.hypot
+    return list(accumulate(
+        (hypot(x1 - x0, y1 - y0)
+         for x0, y0, x1, y1 in zip(xs, ys, xs[1:], ys[1:])),
+        initial=0.0
+    ))
+
+
+def point_at_length(cumulative: list[float], points: PointArray, distance: float) -> Optional[Point]:
+    """
+    Find the point a given distance along a polyline.
+    
+    Uses binary search over the cumulative lengths, so repeated queries on
+    the same polyline don't re-walk it.
+    
+    Args:
+        cumulative: Cumulative lengths from curve_lengths(points)
+        points: Polyline as parallel x/y coordinates
+        distance: Distance along the polyline (clamped to its length)
+    
+    Returns:
+        Interpolated point, or None if the polyline has no points
+    """
+    xs, ys = points
+    if not xs:
+        return None
+    if distance <= 0.0 or len(xs) < 2:
+        return Point(xs[0], ys[0])
+    if distance >= cumulative[-1]:
+        return Point(xs[-1], ys[-1])
+    
+    i = bisect_left(cumulative, distance)
+    seg_start = cumulative[i - 1]
+    seg_len = cumulative[i] - seg_start
+    t = (distance - seg_start) / seg_len if seg_len > 0 else 0.0
+    return Point(lerp(xs[i - 1], xs[i], t), lerp(ys[i - 1], ys[i], t))
 
 
 def adaptive_decompose_quadratic(
     p0: Point,
     p1: Point,
     p2: Point,
-    max_segment_length: float = 6.0,
-    min_segments: int = 3,
-    max_segments: int = 20
+    tolerance: float = 0.25,
+    max_depth: int = 8
 ) -> list[Point]:
     """
-    Decompose a quadratic Bezier with adaptive segment count.
+    Decompose a quadratic Bezier by recursive subdivision until flat.
     
-    Creates more segments for longer/curvier paths.
+    Near-straight curves get few points and tight curls get more, so the
+    polyline stays within the tolerance with fewer points than uniform
+    sampling.
     
     Args:
         p0: Start point
         p1: Control point
         p2: End point
-        max_segment_length: Target max length per segment (inches)
-        min_segments: Minimum number of segments
-        max_segments: Maximum number of segments
+        tolerance: Max distance of the control point from the chord (inches)
+        max_depth: Maximum subdivision depth (at most 2**max_depth segments)
     
     Returns:
-        List of points
+        List of points (including start and end)
+    """
+    xs = [p0.x]
+    ys = [p0.y]
+    _subdivide_quadratic(p0.x, p0.y, p1.x, p1.y, p2.x, p2.y,
+                         tolerance, max_depth, xs, ys)
+    return PointArray(xs, ys).to_points()
+
+
+def adaptive_decompose_cubic(
+    p0: Point,
+    p1: Point,
+    p2: Point,
+    p3: Point,
+    tolerance: float = 0.25,
+    max_depth: int = 8
+) -> list[Point]:
     """
-    # Estimate curve length using control polygon
-    rough_length = p0.distance_to(p1) + p1.distance_to(p2)
+    Decompose a cubic Bezier by recursive subdivision until flat.
+    
+    Args:
+        p0: Start point
+        p1: First control point
+        p2: Second control point
+        p3: End point
+        tolerance: Max distance of either control point from the chord (inches)
+        max_depth: Maximum subdivision depth (at most 2**max_depth segments)
+    
+    Returns:
+        List of points (including start and end)
+    """
+    xs = [p0.x]
+    ys = [p0.y]
+    _subdivide_cubic(p0.x, p0.y, p1.x, p1.y, p2.x, p2.y, p3.x, p3.y,
+                     tolerance, max_depth, xs, ys)
+    return PointArray(xs, ys).to_points()
+
+
+def _segment_distance(px: float, py: float,
+                      ax: float, ay: float,
+                      bx: float, by: float) -> float:
+    """Distance from (px, py) to the segment from (ax, ay) to (bx, by)."""
+    dx = bx - ax
+    dy = by - ay
+    len_sq = dx * dx + dy * dy
+    if len_sq == 0:
+        return math.hypot(px - ax, py - ay)
+    
+    t = ((px - ax) * dx + (py - ay) * dy) / len_sq
+    t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+    return math.hypot(px - (ax + t * dx), py - (ay + t * dy))
+
+
+def _subdivide_quadratic(x0, y0, x1, y1, x2, y2, tolerance, depth, xs, ys) -> None:
+    """Append points after (x0, y0) for a flat-enough quadratic polyline."""
+    if depth <= 0 or _segment_distance(x1, y1, x0, y0, x2, y2) <= tolerance:
+        xs.append(x2)
+        ys.append(y2)
+        return
+    
+    # Split at t = 0.5 (de Casteljau)
+    x01, y01 = (x0 + x1) * 0.5, (y0 + y1) * 0.5
+    x12, y12 = (x1 + x2) * 0.5, (y1 + y2) * 0.5
+    mx, my = (x01 + x12) * 0.5, (y01 + y12) * 0.5
+    
+    _subdivide_quadratic(x0, y0, x01, y01, mx, my, tolerance, depth - 1, xs, ys)
+    _subdivide_quadratic(mx, my, x12, y12, x2, y2, tolerance, depth - 1, xs, ys)
+
+
+def _subdivide_cubic(x0, y0, x1, y1, x2, y2, x3, y3, tolerance, depth, xs, ys) -> None:
+    """Append points after (x0, y0) for a flat-enough cubic polyline."""
+    if depth <= 0 or max(
+        _segment_distance(x1, y1, x0, y0, x3, y3),
+        _segment_distance(x2, y2, x0, y0, x3, y3)
+    ) <= tolerance:
+        xs.append(x3)
+        ys.append(y3)
+        return
     
-    # Calculate number of segments
-    num_segments = int(rough_length / max_segment_length)
-    num_segments = max(min_segments, min(max_segments, num_segments))
+    # Split at t = 0.5 (de Casteljau)
+    x01, y01 = (x0 + x1) * 0.5, (y0 + y1) * 0.5
+    x12, y12 = (x1 + x2) * 0.5, (y1 + y2) * 0.5
+    x23, y23 = (x2 + x3) * 0.5, (y2 + y3) * 0.5
+    xa, ya = (x01 + x12) * 0.5, (y01 + y12) * 0.5
+    xb, yb = (x12 + x23) * 0.5, (y12 + y23) * 0.5
+    mx, my = (xa + xb) * 0.5, (ya + yb) * 0.5
     
-    return decompose_quadratic_bezier(p0, p1, p2, num_segments)
+    _subdivide_cubic(x0, y0, x01, y01, xa, ya, mx, my, tolerance, depth - 1, xs, ys)
+    _subdivide_cubic(mx, my, xb, yb, x23, y23, x3, y3, tolerance, depth - 1, xs, ys)
 
 
 def point_to_line_distance(point: Point, line_start: Point, line_end: Point) -> float:
@@ -193,31 +413,110 @@ def point_to_line_distance(point: Point, line_start: Point, line_end: Point) ->
     Returns:
         Distance in same units as input
     """
+    return points_to_line_distance(
+        PointArray([point.x], [point.y]), line_start, line_end
+    )[0]
+
+
+def points_to_line_distance(
+    points: PointArray,
+    line_start: Point,
+    line_end: Point
+) -> list[float]:
+    """
+    Calculate distances from many points to a single line segment.
+    
+    Args:
+        points: Candidate points as parallel x/y coordinates
+        line_start: Start of line segment
+        line_end: End of line segment
+    
+    Returns:
+        List of distances, one per candidate point
+    """
+    sx, sy = line_start.x, line_start.y
     # Vector from line_start to line_end
-    line_vec = line_end - line_start
-    # Vector from line_start to point
-    point_vec = point - line_start
+    dx = line_end.x - sx
+    dy = line_end.y - sy
     
-    line_len_sq = line_vec.x**2 + line_vec.y**2
+    line_len_sq = dx * dx + dy * dy
+    hypot = math.hypot
     
     if line_len_sq == 0:
         # Line is a point
-        return point.distance_to(line_start)
+        return [hypot(px - sx, py - sy) for px, py in zip(*points)]
+    
+    distances = []
+    for px, py in zip(*points):
+        # Project point onto line
+        t = ((px - sx) * dx + (py - sy) * dy) / line_len_sq
+        t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+        distances.append(hypot(px - (sx + t * dx), py - (sy + t * dy)))
+    return distances
+
+
+def nearest_segment(
+    point: Point,
+    starts: PointArray,
+    ends: PointArray
+) -> Optional[tuple[int, float]]:
+    """
+    Find the line segment closest to a point (e.g. for hit-testing).
+    
+    Args:
+        point: The query point
+        starts: Start points of the segments
+        ends: End points of the segments
+    
+    Returns:
+        (segment index, distance), or None if there are no segments
+    """
+    px, py = point.x, point.y
+    best_index = None
+    best_distance = math.inf
+    
+    for i, (sx, sy, ex, ey) in enumerate(zip(starts.xs, starts.ys, ends.xs, ends.ys)):
+        distance = _segment_distance(px, py, sx, sy, ex, ey)
+        if distance < best_distance:
+            best_index = i
+            best_distance = distance
+    
+    if best_index is None:
+        return None
+    return (best_index, best_distance)
+
+
+def first_point_within(points: PointArray, point: Point, radius: float) -> Optional[int]:
+    """
+    Find the first point within a radius of a query point (e.g. for hit-testing).
+    
+    Compares squared distances, so no square roots are taken.
+    
+    Args:
+        points: Points to search, in priority order
+        point: The query point
+        radius: Maximum distance to count as a hit
+    
+    Returns:
+        Index of the first point within radius, or None
+    """
+    px, py = point.x, point.y
+    radius_sq = radius * radius
     
-    # Project point onto line
-    t = max(0, min(1, (point_vec.x * line_vec.x + point_vec.y * line_vec.y) / line_len_sq))
+    for i, (x, y) in enumerate(zip(points.xs, points.ys)):
+        dx = x - px
+        dy = y - py
+        if dx * dx + dy * dy <= radius_sq:
+            return i
     
-    projection = Point(line_start.x + t * line_vec.x, line_start.y + t * line_vec.y)
-    return point.distance_to(projection)
+    return None
 
 
 def normalize_angle(angle: float) -> float:
     """Normalize angle to 0-360 range."""
-    while angle < 0:
-        angle += 360
-    while angle >= 360:
-        angle -= 360
-    return angle
+    angle %= 360.0
+    # A tiny negative input can round up to exactly 360
+    return angle if angle < 360.0 else 0.0
 
 
 def angle_difference(from_angle: float, to_angle: float) -> float:
@@ -226,9 +525,5 @@ def angle_difference(from_angle: float, to_angle: float) -> float:
     
     Returns value in range -180 to 180.
     """
-    diff = normalize_angle(to_angle) - normalize_angle(from_angle)
-    if diff > 180:
-        diff -= 360
-    elif diff < -180:
-        diff += 360
-    return diff
\ No newline at end of file
+    diff = (to_angle - from_angle) % 360.0
+    return diff - 360.0 if diff > 180.0 else diff
@@ -7,8 +7,10 @@ Core data models for the path planner.
 """
 
 from dataclasses import dataclass, field
-from typing import Optional
+from typing import Callable, Optional
 from enum import Enum
+import operator
+from path_planner.core.coordinates import calculate_headings
 
 
 class MotionType(Enum):
@@ -38,8 +40,46 @@ class Alliance(Enum):
     BLUE = "blue"
 
 
-@dataclass
-class Waypoint:
+# Value -> member tables; faster than Enum(value), which is used per waypoint
+_HEADING_MODE_VALUES = {m.value: m for m in HeadingMode}
+_MOTION_TYPE_VALUES = {m.value: m for m in MotionType}
+_SIDE_VALUES = {s.value: s for s in Side}
+_ALLIANCE_VALUES = {a.value: a for a in Alliance}
+
+
+def _any_x(x: float) -> bool:
+    return True
+
+
+def _left_x(x: float) -> bool:
+    return x <= 0
+
+
+def _right_x(x: float) -> bool:
+    return x >= 0
+
+
+# Position check for each side, resolved once when a path's side is set
+_SIDE_PREDICATES = {Side.FULL: _any_x, Side.LEFT: _left_x, Side.RIGHT: _right_x}
+
+
+class _DirtyTracking:
+    """
+    Mixin that marks an object dirty whenever a public field is assigned.
+    
+    Used to cache to_dict() results between saves.
+    """
+    
+    __slots__ = ()
+    
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if not name.startswith("_"):
+            object.__setattr__(self, "_dirty", True)
+
+
+@dataclass(slots=True)
+class Waypoint(_DirtyTracking):
     """A single waypoint in an autonomous path."""
     x: float                                    # Position in inches
     y: float                                    # Position in inches
@@ -51,9 +91,24 @@ class Waypoint:
     conveyor: bool = False                      # Run conveyor while moving
     commands_after: list[str] = field(default_factory=list)  # Command IDs
     
+    # to_dict() cache, invalidated when a field is assigned
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
+        """
+        Convert to dictionary for JSON serialization.
+        
+        The result is cached until a field changes, so callers must not
+        mutate it.
+        """
+        cached = self._cached_dict
+        # commands_after is edited in place, so compare it explicitly
+        if (cached is not None and not self._dirty
+                and cached["commands_after"] == self.commands_after):
+            return cached
+        
+        cached = {
             "x": self.x,
             "y": self.y,
             "heading": self.heading,
@@ -64,6 +119,9 @@ class Waypoint:
             "conveyor": self.conveyor,
             "commands_after": self.commands_after.copy()
         }
+        self._cached_dict = cached
+        self._dirty = False
+        return cached
     
     @classmethod
     def from_dict(cls, data: dict) -> "Waypoint":
@@ -72,23 +130,35 @@ class Waypoint:
             x=data["x"],
             y=data["y"],
             heading=data.get("heading"),
-            heading_mode=HeadingMode(data.get("heading_mode", "auto")),
-            motion_type=MotionType(data.get("motion_type", "moveToPose")),
+            heading_mode=_HEADING_MODE_VALUES[data.get("heading_mode", "auto")],
+            motion_type=_MOTION_TYPE_VALUES[data.get("motion_type", "moveToPose")],
             reverse=data.get("reverse", False),
             intaking=data.get("intaking", False),
             conveyor=data.get("conveyor", False),
-            commands_after=data.get("commands_after", [])
+            commands_after=list(data.get("commands_after", []))
         )
 
 
-@dataclass
-class Path:
+@dataclass(slots=True)
+class Path(_DirtyTracking):
     """A complete autonomous path."""
     name: str
     alliance: Alliance = Alliance.RED
     side: Side = Side.LEFT
     waypoints: list[Waypoint] = field(default_factory=list)
     
+    # to_dict() cache, invalidated when a field is assigned
+    _cached_dict: Optional[dict] = field(default=None, init=False, repr=False, compare=False)
+    _dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    
+    # is_valid_position() predicate for the current side (set with side)
+    _valid_x: Callable[[float], bool] = field(init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value) -> None:
+        _DirtyTracking.__setattr__(self, name, value)
+        if name == "side":
+            object.__setattr__(self, "_valid_x", _SIDE_PREDICATES[value])
+    
     def add_waypoint(self, x: float, y: float) -> int:
         """Add a waypoint and return its index."""
         motion = MotionType.START if len(self.waypoints) == 0 else MotionType.MOVE_TO_POSE
@@ -106,35 +176,57 @@ class Path:
     
     def is_valid_position(self, x: float, y: float) -> bool:
         """Check if position is allowed for this path's side."""
-        if self.side == Side.FULL:
-            return True
-        elif self.side == Side.LEFT:
-            return x <= 0
-        else:  # RIGHT
-            return x >= 0
+        return self._valid_x(x)
+    
+    def segment_headings(self) -> list[float]:
+        """
+        Get the auto heading of each segment between consecutive waypoints.
+        
+        Entry i is the heading from waypoint i to waypoint i + 1.
+        """
+        waypoints = self.waypoints
+        return calculate_headings([wp.x for wp in waypoints], [wp.y for wp in waypoints])
     
     def to_dict(self) -> dict:
-        """Convert to dictionary for JSON serialization."""
-        return {
+        """
+        Convert to dictionary for JSON serialization.
+        
+        The result is cached until the path or any of its waypoints
+        changes, so callers must not mutate it.
+        """
+        waypoint_dicts = [w.to_dict() for w in self.waypoints]
+        
+        cached = self._cached_dict
+        # The waypoints list is edited in place; unchanged waypoints hand
+        # back the very same cached dicts, so an identity check suffices
+        if (cached is not None and not self._dirty
+                and len(cached["waypoints"]) == len(waypoint_dicts)
+                and all(map(operator.is_, cached["waypoints"], waypoint_dicts))):
+            return cached
+        
+        cached = {
             "name": self.name,
             "alliance": self.alliance.value,
             "side": self.side.value,
-            "waypoints": [w.to_dict() for w in self.waypoints]
+            "waypoints": waypoint_dicts
         }
+        self._cached_dict = cached
+        self._dirty = False
+        return cached
     
     @classmethod
     def from_dict(cls, data: dict) -> "Path":
         """Create from dictionary."""
         path = cls(
             name=data["name"],
-            alliance=Alliance(data.get("alliance", "red")),
-            side=Side(data.get("side", "left"))
+            alliance=_ALLIANCE_VALUES[data.get("alliance", "red")],
+            side=_SIDE_VALUES[data.get("side", "left")]
         )
         path.waypoints = [Waypoint.from_dict(w) for w in data.get("waypoints", [])]
         return path
 
 
-@dataclass
+@dataclass(slots=True)
 class Project:
     """A project containing multiple paths."""
     season: str = "pushback_2026"
@@ -1,19 +1,34 @@
 """
 Undo/Redo system for the path planner.
 
-Uses a simple command pattern with state snapshots.
+Uses a simple command pattern with state snapshots. Snapshots are stored
+pickled, which is cheaper than a recursive deepcopy and keeps the history
+compact.
+
+States that are never mutated (like Project.to_dict(), whose path and
+waypoint dicts are cached and replaced rather than edited) can be stored
+without copying, so consecutive snapshots share everything that didn't
+change.
 """
 
-import copy
+import pickle
+from collections import deque
 from dataclasses import dataclass
 from typing import Any, Callable, Optional
 
 
-@dataclass
+@dataclass(slots=True)
 class UndoState:
     """A snapshot of application state."""
     description: str
-    state: Any  # Deep copy of the state
+    state: Any           # Pickled copy of the state, or the state itself
+    pickled: bool = True
+    
+    def load(self) -> Any:
+        """Get the stored state (a fresh copy if it was pickled)."""
+        if self.pickled:
+            return pickle.loads(self.state)
+        return self.state
 
 
 class UndoManager:
@@ -31,29 +46,38 @@ class UndoManager:
             max_history: Maximum number of undo states to keep
         """
         self.max_history = max_history
-        self.undo_stack: list[UndoState] = []
-        self.redo_stack: list[UndoState] = []
+        # Bounded deques drop the oldest entries in O(1)
+        self.undo_stack: deque[UndoState] = deque(maxlen=max_history)
+        self.redo_stack: deque[UndoState] = deque(maxlen=max_history)
         self._on_change_callbacks: list[Callable[[], None]] = []
     
-    def save_state(self, state: Any, description: str = "Edit") -> None:
+    def save_state(self, state: Any, description: str = "Edit", copy: bool = True) -> None:
         """
         Save a state snapshot for undo.
         
+        With copy, the state is pickled before returning, so the caller is
+        free to keep mutating it. Without copy, it is stored as-is and
+        undo/redo hand back that same object, so neither the caller nor
+        whoever restores it may mutate it.
+        
         Args:
-            state: The current state (will be deep copied)
+            state: The current state (must be picklable if copied)
             description: Human-readable description of the action
+            copy: Whether to store a pickled copy
         """
-        # Deep copy to avoid reference issues
-        snapshot = UndoState(description=description, state=copy.deepcopy(state))
+        if copy:
+            # Serialize to avoid reference issues
+            snapshot = UndoState(
+                description=description,
+                state=pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL)
+            )
+        else:
+            snapshot = UndoState(description=description, state=state, pickled=False)
         self.undo_stack.append(snapshot)
         
         # Clear redo stack (new action invalidates redo history)
         self.redo_stack.clear()
         
-        # Limit history size
-        while len(self.undo_stack) > self.max_history:
-            self.undo_stack.pop(0)
-        
         self._notify_change()
     
     def undo(self) -> Optional[Any]:
@@ -76,7 +100,7 @@ class UndoManager:
         
         # Return the state to restore (one before current)
         if self.undo_stack:
-            return copy.deepcopy(self.undo_stack[-1].state)
+            return self.undo_stack[-1].load()
         return None
     
     def redo(self) -> Optional[Any]:
@@ -97,7 +121,7 @@ class UndoManager:
         
         self._notify_change()
         
-        return copy.deepcopy(state.state)
+        return state.load()
     
     def can_undo(self) -> bool:
         """Check if undo is available."""
@@ -176,11 +200,9 @@ class BatchUndoContext:
         self.manager = manager
         self.get_state = get_state
         self.description = description
-        self.initial_state = None
     
     def __enter__(self):
-        # Save state before changes
-        self.initial_state = copy.deepcopy(self.get_state())
+        # The pre-batch state is already the top of the undo stack
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
@@ -1,36 +1,53 @@
 """
 Clipboard operations for exporting code.
+
+tkinter is imported lazily so that headless use of path_planner.io
+(loading projects, exporting code) doesn't pay for loading Tk.
 """
 
-import tkinter as tk
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    import tkinter as tk
+
+
+# Hidden root window shared by calls made without a root
+_hidden_root: Optional["tk.Tk"] = None
 
 
-def copy_to_clipboard(text: str, root: Optional[tk.Tk] = None) -> bool:
+def _get_hidden_root() -> "tk.Tk":
+    """Get the shared hidden Tk root, creating it on first use."""
+    global _hidden_root
+    
+    if _hidden_root is None:
+        import tkinter as tk
+        
+        _hidden_root = tk.Tk()
+        _hidden_root.withdraw()
+    
+    return _hidden_root
+
+
+def copy_to_clipboard(text: str, root: Optional["tk.Tk"] = None) -> bool:
     """
     Copy text to system clipboard.
     
     Args:
         text: Text to copy
-        root: Tkinter root window (creates temporary one if None)
+        root: Tkinter root window (uses a shared hidden one if None)
     
     Returns:
         True if successful
     """
     try:
         if root is None:
-            root = tk.Tk()
-            root.withdraw()
-            cleanup = True
-        else:
-            cleanup = False
+            root = _get_hidden_root()
         
         root.clipboard_clear()
         root.clipboard_append(text)
-        root.update()
-        
-        if cleanup:
-            root.destroy()
+        # Flush pending idle work without re-entering the event loop
+        # (update() would also run queued user events mid-handler)
+        root.update_idletasks()
         
         return True
     
@@ -39,30 +56,23 @@ def copy_to_clipboard(text: str, root: Optional[tk.Tk] = None) -> bool:
         return False
 
 
-def get_from_clipboard(root: Optional[tk.Tk] = None) -> Optional[str]:
+def get_from_clipboard(root: Optional["tk.Tk"] = None) -> Optional[str]:
     """
     Get text from system clipboard.
     
     Args:
-        root: Tkinter root window
+        root: Tkinter root window (uses a shared hidden one if None)
     
     Returns:
         Clipboard text, or None if empty/error
     """
+    import tkinter as tk
+    
     try:
         if root is None:
-            root = tk.Tk()
-            root.withdraw()
-            cleanup = True
-        else:
-            cleanup = False
-        
-        text = root.clipboard_get()
-        
-        if cleanup:
-            root.destroy()
+            root = _get_hidden_root()
         
-        return text
+        return root.clipboard_get()
     
     except tk.TclError:
         return None
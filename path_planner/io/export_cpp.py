@@ -10,7 +10,6 @@ from datetime import datetime
 from typing import Optional
 from path_planner.core.models import Path, Waypoint, MotionType, HeadingMode
 from path_planner.core.commands import Command
-from path_planner.core.coordinates import calculate_heading
 
 
 def export_path_to_cpp(
@@ -110,11 +109,14 @@ def _generate_function(path: Path, commands: dict[str, Command]) -> list[str]:
         lines.append('}')
         return lines
     
+    # Auto headings for every segment, computed in one pass
+    segment_headings = path.segment_headings()
+    
     for i, wp in enumerate(waypoints):
         lines.append(f'    // ─── Waypoint {i + 1} {"(Start)" if i == 0 else ""} ───')
         
         # Calculate heading
-        heading = _get_heading(wp, waypoints, i)
+        heading = _get_heading(wp, segment_headings, i)
         heading_str = f"{heading:.1f}" if heading is not None else "0.0"
         
         lines.append(f'    // Position: ({wp.x:.1f}, {wp.y:.1f}), Heading: {heading_str}°')
@@ -157,19 +159,25 @@ def _generate_function(path: Path, commands: dict[str, Command]) -> list[str]:
     return lines
 
 
-def _get_heading(wp: Waypoint, waypoints: list[Waypoint], index: int) -> Optional[float]:
-    """Calculate heading for a waypoint."""
+def _get_heading(wp: Waypoint, segment_headings: list[float], index: int) -> Optional[float]:
+    """
+    Calculate heading for a waypoint.
+    
+    Args:
+        wp: The waypoint
+        segment_headings: Headings between consecutive waypoints
+            (from Path.segment_headings)
+        index: Index of the waypoint in its path
+    """
     if wp.heading_mode == HeadingMode.MANUAL and wp.heading is not None:
         return wp.heading
     
-    # Auto: calculate from direction to next waypoint
-    if index < len(waypoints) - 1:
-        next_wp = waypoints[index + 1]
-        return calculate_heading(wp.x, wp.y, next_wp.x, next_wp.y)
+    # Auto: direction to next waypoint
+    if index < len(segment_headings):
+        return segment_headings[index]
     
     # Last waypoint: use direction from previous
     if index > 0:
-        prev_wp = waypoints[index - 1]
-        return calculate_heading(prev_wp.x, prev_wp.y, wp.x, wp.y)
+        return segment_headings[index - 1]
     
-    return 0.0
\ No newline at end of file
+    return 0.0
@@ -10,6 +10,11 @@ from datetime import datetime
 from typing import Optional
 from path_planner.core.models import Project, Path, Waypoint
 
+try:
+    import orjson  # Optional: much faster JSON encode/decode
+except ImportError:
+    orjson = None
+
 
 VERSION = "1.0.0"
 
@@ -33,8 +38,7 @@ def save_project(project: Project, filepath: str) -> bool:
         if "created" not in data:
             data["created"] = data["modified"]
         
-        with open(filepath, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(filepath, data)
         
         return True
     
@@ -58,8 +62,7 @@ def load_project(filepath: str) -> Optional[Project]:
         return None
     
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = _read_json(filepath)
         
         # Version check
         file_version = data.get("version", "0.0.0")
@@ -76,6 +79,25 @@ def load_project(filepath: str) -> Optional[Project]:
         return None
 
 
+def _write_json(filepath: str, data: dict) -> None:
+    """Write data as indented JSON, using orjson when available."""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(data, f, indent=2)
+
+
+def _read_json(filepath: str) -> dict:
+    """Read a JSON file, using orjson when available."""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            return orjson.loads(f.read())
+    with open(filepath, 'r') as f:
+        return json.load(f)
+
+
 def _is_compatible_version(file_version: str) -> bool:
     """Check if a file version is compatible with current version."""
     try:
@@ -109,8 +131,7 @@ def get_project_info(filepath: str) -> Optional[dict]:
         Dict with name, season, path count, modified date
     """
     try:
-        with open(filepath, 'r') as f:
-            data = json.load(f)
+        data = _read_json(filepath)
         
         return {
             "season": data.get("season", "unknown"),
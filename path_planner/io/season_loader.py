@@ -4,9 +4,21 @@ Load season configurations and command libraries.
 
 import json
 import os
+import threading
+import time
+from collections import defaultdict
 from typing import Optional
 from path_planner.core.commands import Command, CommandSequence
 
+try:
+    import orjson  # Optional: much faster JSON decode
+except ImportError:
+    orjson = None
+
+
+# Seconds before list_seasons() rescans the seasons folder in the background
+SEASONS_CACHE_MAX_AGE = 5.0
+
 
 class SeasonLoader:
     """Loads commands from command_library/ and season configs."""
@@ -23,8 +35,26 @@ class SeasonLoader:
         self.seasons_path = os.path.join(base_path, "seasons")
         
         self.commands: dict[str, Command] = {}
+        
+        # Command objects reused across this loader's season loads, keyed by
+        # command ID; never shared with other loaders
+        self._command_pool: dict[str, Command] = {}
         self.sequences: dict[str, CommandSequence] = {}
         self.season_config: dict = {}
+        
+        # get_commands_by_category() result, reset whenever commands change
+        self._by_category: Optional[dict[str, list[Command]]] = None
+        
+        # Decoded JSON files keyed by path, with the (mtime_ns, size) they
+        # were read at, so reopening a season skips re-parsing
+        self._json_cache: dict[str, tuple[int, int, dict]] = {}
+        
+        # Season folder names from the last scan, and when it finished;
+        # nothing is scanned until list_seasons() is first called
+        self._seasons_lock = threading.Lock()
+        self._seasons_cache: Optional[list[str]] = None
+        self._seasons_scanned_at = 0.0
+        self._seasons_refreshing = False
     
     def load_season(self, season_name: str) -> bool:
         """
@@ -38,21 +68,20 @@ class SeasonLoader:
         """
         config_path = os.path.join(self.seasons_path, season_name, "config.json")
         
-        if not os.path.exists(config_path):
+        try:
+            self.season_config = self._load_json_cached(config_path)
+        except FileNotFoundError:
             print(f"Season config not found: {config_path}")
             # Load default commands anyway
             self._load_default_commands()
             return False
-        
-        try:
-            with open(config_path, 'r') as f:
-                self.season_config = json.load(f)
         except Exception as e:
             print(f"Error loading season config: {e}")
             self._load_default_commands()
             return False
         
         self.commands.clear()
+        self._by_category = None
         self.sequences.clear()
         
         # Load commands from command library
@@ -71,7 +100,7 @@ class SeasonLoader:
         
         # Load custom commands
         for cmd_data in self.season_config.get("custom_commands", []):
-            cmd = Command.from_dict(cmd_data)
+            cmd = self._pooled_command(cmd_data)
             self.commands[cmd.id] = cmd
         
         # Load sequences
@@ -85,23 +114,66 @@ class SeasonLoader:
         """Load commands from a category JSON file."""
         file_path = os.path.join(self.command_library_path, f"{category}.json")
         
-        if not os.path.exists(file_path):
+        try:
+            data = self._load_json_cached(file_path)
+        except FileNotFoundError:
             print(f"Command category not found: {file_path}")
             return
-        
-        try:
-            with open(file_path, 'r') as f:
-                data = json.load(f)
         except Exception as e:
             print(f"Error loading command category {category}: {e}")
             return
         
         category_name = data.get("category", category)
         
-        for cmd_data in data.get("commands", []):
-            cmd_data["category"] = category_name
-            cmd = Command.from_dict(cmd_data)
-            self.commands[cmd.id] = cmd
+        # Merging a whole dict lets update() grow the table once for the
+        # file, instead of resizing as single entries are inserted
+        self.commands.update({
+            cmd.id: cmd
+            for cmd in (
+                self._pooled_command(cmd_data, category_name)
+                for cmd_data in data.get("commands", [])
+            )
+        })
+    
+    def _pooled_command(self, data: dict, category: Optional[str] = None) -> Command:
+        """
+        Get a Command for data, resetting a pooled instance if one exists.
+        
+        Args:
+            data: Command dictionary
+            category: Category to use instead of data's "category"
+        """
+        cmd = self._command_pool.get(data["id"])
+        if cmd is None:
+            if category is None:
+                cmd = Command.from_dict(data)
+            else:
+                cmd = Command.from_dict_with_category(data, category)
+            self._command_pool[cmd.id] = cmd
+        else:
+            cmd.reset_from_dict(data, category)
+        return cmd
+    
+    def _load_json_cached(self, file_path: str) -> dict:
+        """
+        Load a JSON file, reusing the decoded result if it hasn't changed.
+        
+        The returned dict is shared with the cache and must not be modified.
+        """
+        st = os.stat(file_path)
+        cached = self._json_cache.get(file_path)
+        if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+            return cached[2]
+        
+        if orjson is not None:
+            with open(file_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(file_path, 'r') as f:
+                data = json.load(f)
+        
+        self._json_cache[file_path] = (st.st_mtime_ns, st.st_size, data)
+        return data
     
     def _load_default_commands(self) -> None:
         """Load a minimal set of default commands."""
@@ -125,29 +197,82 @@ class SeasonLoader:
         
         for cmd in defaults:
             self.commands[cmd.id] = cmd
+        self._by_category = None
     
     def get_command(self, cmd_id: str) -> Optional[Command]:
         """Get a command by ID."""
         return self.commands.get(cmd_id)
     
     def get_commands_by_category(self) -> dict[str, list[Command]]:
-        """Get all commands grouped by category."""
-        by_category: dict[str, list[Command]] = {}
+        """
+        Get all commands grouped by category.
         
-        for cmd in self.commands.values():
-            if cmd.category not in by_category:
-                by_category[cmd.category] = []
-            by_category[cmd.category].append(cmd)
+        The grouping is cached until commands change, so callers must not
+        modify it.
+        """
+        if self._by_category is None:
+            by_category: defaultdict[str, list[Command]] = defaultdict(list)
+            for cmd in self.commands.values():
+                by_category[cmd.category].append(cmd)
+            self._by_category = dict(by_category)
         
-        return by_category
+        return self._by_category
     
     def list_seasons(self) -> list[str]:
-        """List available seasons."""
+        """
+        List available seasons.
+        
+        Returns the result of the last scan, starting a background rescan
+        if it is older than SEASONS_CACHE_MAX_AGE. Scans synchronously only
+        if no scan has finished yet.
+        """
+        with self._seasons_lock:
+            seasons = self._seasons_cache
+            stale = time.monotonic() - self._seasons_scanned_at > SEASONS_CACHE_MAX_AGE
+        
+        if seasons is None:
+            seasons = self._scan_seasons()
+            self._store_seasons(seasons)
+        elif stale:
+            self._start_seasons_refresh()
+        
+        return list(seasons)
+    
+    def _start_seasons_refresh(self) -> None:
+        """Rescan the seasons folder on a daemon thread (once at a time)."""
+        with self._seasons_lock:
+            if self._seasons_refreshing:
+                return
+            self._seasons_refreshing = True
+        
+        threading.Thread(target=self._refresh_seasons_bg, daemon=True).start()
+    
+    def _refresh_seasons_bg(self) -> None:
+        """Background thread body for _start_seasons_refresh."""
+        try:
+            self._store_seasons(self._scan_seasons())
+        except Exception as e:
+            print(f"Error scanning seasons: {e}")
+        finally:
+            with self._seasons_lock:
+                self._seasons_refreshing = False
+    
+    def _store_seasons(self, seasons: list[str]) -> None:
+        """Store a finished season scan in the cache."""
+        with self._seasons_lock:
+            self._seasons_cache = seasons
+            self._seasons_scanned_at = time.monotonic()
+    
+    def _scan_seasons(self) -> list[str]:
+        """Scan the seasons folder for folders with a config.json."""
         seasons = []
-        if os.path.exists(self.seasons_path):
-            for item in os.listdir(self.seasons_path):
-                item_path = os.path.join(self.seasons_path, item)
-                config_path = os.path.join(item_path, "config.json")
-                if os.path.isdir(item_path) and os.path.exists(config_path):
-                    seasons.append(item)
+        if not os.path.exists(self.seasons_path):
+            return seasons
+        
+        # scandir reuses directory-entry type info, saving a stat per entry
+        with os.scandir(self.seasons_path) as entries:
+            for entry in entries:
+                config_path = os.path.join(entry.path, "config.json")
+                if entry.is_dir() and os.path.exists(config_path):
+                    seasons.append(entry.name)
         return seasons
\ No newline at end of file
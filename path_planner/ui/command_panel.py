@@ -8,6 +8,7 @@ Displays:
 
 import tkinter as tk
 from tkinter import ttk
+from collections import defaultdict
 from typing import Optional, Callable
 from path_planner.core.models import Waypoint
 from path_planner.core.commands import Command
@@ -18,11 +19,21 @@ class CommandPanel(ttk.LabelFrame):
     Panel for managing commands at a waypoint.
     """
     
+    # Row number prefixes ("1. ", "2. ", ...) for the command listbox
+    _PREFIX_POOL = [f"{i + 1}. " for i in range(256)]
+    
     def __init__(self, parent, **kwargs):
         super().__init__(parent, text="Commands", **kwargs)
         
         self.waypoint: Optional[Waypoint] = None
         self.commands: dict[str, Command] = {}
+        self.commands_by_category: dict[str, list[Command]] = {}
+        
+        # Whether commands can be added (off while a season is loading)
+        self._commands_enabled = True
+        
+        # Quick button state last applied (None = buttons need a sweep)
+        self._last_can_add: Optional[bool] = None
         
         # Callbacks
         self.on_commands_changed: Optional[Callable[[], None]] = None
@@ -73,53 +84,106 @@ class CommandPanel(ttk.LabelFrame):
         self.category_notebook = ttk.Notebook(quick_frame)
         self.category_notebook.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        self.category_notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        
         # Will be populated when commands are set
         self.category_frames: dict[str, ttk.Frame] = {}
+        
+        # Categories whose buttons are built on first selection
+        self._pending_categories: dict[str, list[Command]] = {}
+        
+        # One Tcl command shared by every quick button; each button passes
+        # its command id as the argument
+        self._quick_command = self.register(self._add_command)
     
-    def set_commands(self, commands: dict[str, Command]) -> None:
+    def set_commands(
+        self,
+        commands: dict[str, Command],
+        by_category: Optional[dict[str, list[Command]]] = None
+    ) -> None:
         """
         Set available commands (from season loader).
         
         Args:
             commands: Dict of command_id -> Command
+            by_category: Commands already grouped by category
+                (e.g. SeasonLoader.get_commands_by_category()); grouped
+                here if not given
         """
         self.commands = commands
+        
+        if by_category is None:
+            grouped: defaultdict[str, list[Command]] = defaultdict(list)
+            for cmd in commands.values():
+                grouped[cmd.category].append(cmd)
+            by_category = dict(grouped)
+        self.commands_by_category = by_category
+        
         self._populate_quick_commands()
     
     def _populate_quick_commands(self) -> None:
         """Populate the quick command buttons by category."""
-        # Clear existing tabs
-        for tab in self.category_notebook.tabs():
-            self.category_notebook.forget(tab)
+        # Destroy existing tabs (also removes them from the notebook)
+        for frame in self.category_frames.values():
+            frame.destroy()
         self.category_frames.clear()
+        self._pending_categories.clear()
+        self._last_can_add = None
         
-        # Group commands by category
-        by_category: dict[str, list[Command]] = {}
-        for cmd in self.commands.values():
-            if cmd.category not in by_category:
-                by_category[cmd.category] = []
-            by_category[cmd.category].append(cmd)
-        
-        # Create tab for each category
-        for category, cmds in sorted(by_category.items()):
+        # Create an empty tab for each category; buttons are built when
+        # the tab is first shown
+        for category, cmds in sorted(self.commands_by_category.items()):
             frame = ttk.Frame(self.category_notebook)
             self.category_notebook.add(frame, text=category)
             self.category_frames[category] = frame
-            
-            # Create buttons in a grid
-            for i, cmd in enumerate(cmds):
-                row = i // 2
-                col = i % 2
-                
-                btn = ttk.Button(
-                    frame, text=cmd.name,
-                    command=lambda c=cmd: self._add_command(c.id)
-                )
-                btn.grid(row=row, column=col, padx=2, pady=2, sticky="ew")
+            self._pending_categories[category] = cmds
             
             # Configure columns to expand
             frame.columnconfigure(0, weight=1)
             frame.columnconfigure(1, weight=1)
+        
+        # Build the first tab now so it isn't blank
+        if self.category_frames:
+            self.category_notebook.select(0)
+            self._on_tab_changed()
+    
+    def _on_tab_changed(self, event=None) -> None:
+        """Build the selected category's buttons if not built yet."""
+        current = self.category_notebook.select()
+        if not current:
+            return
+        
+        category = self.category_notebook.tab(current, "text")
+        cmds = self._pending_categories.pop(category, None)
+        if cmds is not None:
+            self._build_category_buttons(self.category_frames[category], cmds)
+    
+    def _build_category_buttons(self, frame: ttk.Frame, cmds: list[Command]) -> None:
+        """
+        Create quick command buttons for a category tab.
+        
+        Args:
+            frame: Category tab frame
+            cmds: Commands in the category
+        """
+        # Match the state the other tabs were last swept to
+        state = "disabled" if self._last_can_add is False else "normal"
+        
+        # Create buttons in a grid
+        for i, cmd in enumerate(cmds):
+            row = i // 2
+            col = i % 2
+            
+            btn = ttk.Button(
+                frame, text=cmd.name, state=state,
+                command=(self._quick_command, cmd.id)
+            )
+            btn.grid(row=row, column=col, padx=2, pady=2, sticky="ew")
+    
+    def set_commands_enabled(self, enabled: bool) -> None:
+        """Enable/disable adding commands to the waypoint."""
+        self._commands_enabled = enabled
+        self._update_button_states()
     
     def set_waypoint(self, waypoint: Optional[Waypoint]) -> None:
         """Set the current waypoint."""
@@ -134,10 +198,31 @@ class CommandPanel(ttk.LabelFrame):
         if self.waypoint is None:
             return
         
-        for i, cmd_id in enumerate(self.waypoint.commands_after):
-            cmd = self.commands.get(cmd_id)
-            name = cmd.name if cmd else cmd_id
-            self.command_listbox.insert(tk.END, f"{i + 1}. {name}")
+        # Insert all rows in a single Tcl call
+        count = len(self.waypoint.commands_after)
+        if count:
+            self.command_listbox.insert(tk.END, *map(self._label, range(count)))
+    
+    def _label(self, index: int) -> str:
+        """Get the numbered listbox label for the command at index."""
+        cmd_id = self.waypoint.commands_after[index]
+        cmd = self.commands.get(cmd_id)
+        name = cmd.name if cmd else cmd_id
+        
+        if index < len(self._PREFIX_POOL):
+            return self._PREFIX_POOL[index] + name
+        return f"{index + 1}. {name}"
+    
+    def _relabel_range(self, lo: int, hi: int) -> None:
+        """
+        Rewrite listbox rows lo..hi (inclusive) from the waypoint's commands.
+        
+        Args:
+            lo: First row to rewrite
+            hi: Last row to rewrite
+        """
+        self.command_listbox.delete(lo, hi)
+        self.command_listbox.insert(lo, *map(self._label, range(lo, hi + 1)))
     
     def _update_button_states(self) -> None:
         """Update button enabled states."""
@@ -152,18 +237,23 @@ class CommandPanel(ttk.LabelFrame):
         
         self.clear_btn.config(state="normal" if has_commands else "disabled")
         
-        # Enable/disable quick command buttons
+        # Enable/disable quick command buttons (only when it changed)
+        can_add = has_waypoint and self._commands_enabled
+        if can_add == self._last_can_add:
+            return
+        self._last_can_add = can_add
+        
         for frame in self.category_frames.values():
             for child in frame.winfo_children():
-                child.config(state="normal" if has_waypoint else "disabled")
+                child.config(state="normal" if can_add else "disabled")
     
     def _add_command(self, cmd_id: str) -> None:
         """Add a command to the waypoint."""
-        if self.waypoint is None:
+        if self.waypoint is None or not self._commands_enabled:
             return
         
         self.waypoint.commands_after.append(cmd_id)
-        self._refresh_list()
+        self.command_listbox.insert(tk.END, self._label(len(self.waypoint.commands_after) - 1))
         self._notify_change()
     
     def _remove_command(self) -> None:
@@ -178,7 +268,12 @@ class CommandPanel(ttk.LabelFrame):
         index = selection[0]
         if 0 <= index < len(self.waypoint.commands_after):
             self.waypoint.commands_after.pop(index)
-            self._refresh_list()
+            self.command_listbox.delete(index)
+            
+            # Renumber the rows that shifted up
+            last = len(self.waypoint.commands_after) - 1
+            if index <= last:
+                self._relabel_range(index, last)
             self._notify_change()
     
     def _clear_commands(self) -> None:
@@ -203,7 +298,7 @@ class CommandPanel(ttk.LabelFrame):
         if index > 0:
             cmds = self.waypoint.commands_after
             cmds[index], cmds[index - 1] = cmds[index - 1], cmds[index]
-            self._refresh_list()
+            self._relabel_range(index - 1, index)
             self.command_listbox.selection_set(index - 1)
             self._notify_change()
     
@@ -220,7 +315,7 @@ class CommandPanel(ttk.LabelFrame):
         cmds = self.waypoint.commands_after
         if index < len(cmds) - 1:
             cmds[index], cmds[index + 1] = cmds[index + 1], cmds[index]
-            self._refresh_list()
+            self._relabel_range(index, index + 1)
             self.command_listbox.selection_set(index + 1)
             self._notify_change()
     
@@ -2,9 +2,11 @@
 Dialog boxes for the path planner.
 """
 
+import os
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 from typing import Optional
+from path_planner.io.export_clipboard import copy_to_clipboard
 
 
 class ExportDialog(tk.Toplevel):
@@ -46,7 +48,8 @@ class ExportDialog(tk.Toplevel):
             bg="#1e1e1e",
             fg="#d4d4d4",
             insertbackground="#ffffff",
-            font=("Consolas", 10)
+            font=("Consolas", 10),
+            undo=False
         )
         self.code_text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
@@ -59,8 +62,9 @@ class ExportDialog(tk.Toplevel):
         x_scroll.pack(fill=tk.X, padx=10)
         self.code_text.config(xscrollcommand=x_scroll.set)
         
-        # Insert code
+        # Insert code, then make the view read-only
         self.code_text.insert("1.0", self.code)
+        self.code_text.config(state=tk.DISABLED)
         
         # Buttons
         btn_frame = ttk.Frame(self)
@@ -72,10 +76,10 @@ class ExportDialog(tk.Toplevel):
     
     def _copy(self) -> None:
         """Copy code to clipboard."""
-        self.clipboard_clear()
-        self.clipboard_append(self.code)
-        self.update()
-        messagebox.showinfo("Copied", "Code copied to clipboard!")
+        if copy_to_clipboard(self.code, self):
+            messagebox.showinfo("Copied", "Code copied to clipboard!")
+        else:
+            messagebox.showerror("Error", "Failed to copy code to clipboard")
     
     def _save(self) -> None:
         """Save code to file."""
@@ -91,8 +95,13 @@ class ExportDialog(tk.Toplevel):
         
         if filepath:
             try:
-                with open(filepath, 'w') as f:
-                    f.write(self.code)
+                # Translate newlines and encode once, then write in one call
+                code = self.code
+                if os.linesep != "\n":
+                    code = code.replace("\n", os.linesep)
+                
+                with open(filepath, 'wb') as f:
+                    f.write(code.encode("utf-8"))
                 messagebox.showinfo("Saved", f"Code saved to:\n{filepath}")
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to save:\n{e}")
@@ -7,10 +7,13 @@ Handles:
 - Mouse interaction for adding/selecting/dragging waypoints
 """
 
+import math
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk
 from typing import Optional, Callable
 from path_planner.core.coordinates import CoordinateSystem, FIELD_SIZE_INCHES, TILE_SIZE_INCHES, FIELD_HALF_SIZE
+from path_planner.core.geomtry import Point, PointArray, first_point_within
 from path_planner.core.models import Path, Waypoint, MotionType, Side
 
 
@@ -20,6 +23,7 @@ WAYPOINT_RADIUS = 8
 START_WAYPOINT_RADIUS = 10
 SELECTED_RADIUS = 12
 HIT_RADIUS = 15  # For click detection
+MOUSE_MOVE_INTERVAL_MS = 33  # Coordinate display updates at most ~30 Hz
 
 # Colors
 COLOR_GRID = "#444444"
@@ -32,6 +36,35 @@ COLOR_WAYPOINT_START = "#FFD700"
 COLOR_WAYPOINT_SELECTED = "#FF00FF"
 COLOR_HEADING_ARROW = "#FFFFFF"
 
+# Waypoint (radius, fill, text color) by (is_selected, motion_type); motion
+# types not listed use _DEFAULT_WAYPOINT_STYLES[is_selected]
+_WAYPOINT_STYLES = {
+    (True, MotionType.START): (SELECTED_RADIUS, COLOR_WAYPOINT_SELECTED, "#000000"),
+    (False, MotionType.START): (START_WAYPOINT_RADIUS, COLOR_WAYPOINT_START, "#000000"),
+}
+_DEFAULT_WAYPOINT_STYLES = {
+    True: (SELECTED_RADIUS, COLOR_WAYPOINT_SELECTED, "#FFFFFF"),
+    False: (WAYPOINT_RADIUS, COLOR_WAYPOINT, "#FFFFFF"),
+}
+
+
+# Sign of field x on each side's restricted half: a position is off-limits
+# when field_x * sign > 0 (0 = no restriction)
+_RESTRICTED_SIGNS = {Side.FULL: 0.0, Side.LEFT: 1.0, Side.RIGHT: -1.0}
+
+
+@lru_cache(maxsize=720)
+def _heading_vector(heading: float) -> tuple[float, float]:
+    """Get the canvas (dx, dy) unit vector for a heading in degrees."""
+    # Convert heading to canvas angle (0° = up = -90° in canvas coords)
+    angle_rad = math.radians(90 - heading)
+    return math.cos(angle_rad), -math.sin(angle_rad)
+
+
+def _style_for(is_selected: bool, motion_type: MotionType) -> tuple[float, str, str]:
+    """Get (radius, fill color, text color) for a waypoint."""
+    return _WAYPOINT_STYLES.get((is_selected, motion_type), _DEFAULT_WAYPOINT_STYLES[is_selected])
+
 
 class FieldCanvas(ttk.Frame):
     """
@@ -50,6 +83,7 @@ class FieldCanvas(ttk.Frame):
         self.coords = CoordinateSystem(CANVAS_SIZE)
         self.path: Optional[Path] = None
         self.selected_index: Optional[int] = None
+        self._restricted_sign = 0.0  # See _RESTRICTED_SIGNS
         
         # Callbacks
         self.on_waypoint_added: Optional[Callable[[float, float], None]] = None
@@ -61,6 +95,30 @@ class FieldCanvas(ttk.Frame):
         self._dragging = False
         self._drag_index: Optional[int] = None
         
+        # Latest drag position not yet applied, and its after_idle callback
+        self._pending_drag: Optional[tuple[float, float]] = None
+        self._drag_redraw_id: Optional[str] = None
+        
+        # Last field position applied to the dragged waypoint (None = not moved)
+        self._last_flushed_xy: Optional[tuple[float, float]] = None
+        
+        # Canvas items for the drawn path, and what they currently show
+        self._drawn_path: Optional[Path] = None
+        self._segment_items: list[int] = []
+        self._waypoint_items: list[tuple[int, int]] = []  # (oval, text)
+        self._waypoint_styles: list[tuple[float, str, str]] = []
+        
+        # Canvas positions of the drawn waypoints, as parallel x/y lists
+        self._wp_canvas_xs: list[float] = []
+        self._wp_canvas_ys: list[float] = []
+        
+        # Latest mouse position not yet reported, and its after() callback
+        self._pending_move: Optional[tuple[int, int]] = None
+        self._move_after_id: Optional[str] = None
+        
+        # Set when a redraw was skipped because the canvas wasn't viewable
+        self._needs_redraw = False
+        
         # Create canvas
         self.canvas = tk.Canvas(
             self,
@@ -79,13 +137,19 @@ class FieldCanvas(ttk.Frame):
         self.canvas.bind("<Motion>", self._on_mouse_move)
         self.canvas.bind("<Button-3>", self._on_right_click)
         
+        # Catch up on skipped redraws when the canvas or window is shown
+        # again (child <Map> events also reach the toplevel binding)
+        self.winfo_toplevel().bind("<Map>", self._on_map, add="+")
+        
         # Initial draw
         self._draw_field()
+        self._create_restricted_zones()
     
     def set_path(self, path: Optional[Path]) -> None:
         """Set the current path to display."""
         self.path = path
         self.selected_index = None
+        self._update_side_restriction()
         self.redraw()
     
     def set_selected(self, index: Optional[int]) -> None:
@@ -93,137 +157,263 @@ class FieldCanvas(ttk.Frame):
         self.selected_index = index
         self.redraw()
     
+    def notify_side_changed(self) -> None:
+        """Update the side restriction after the path's side changed."""
+        self._update_side_restriction()
+    
+    def _update_side_restriction(self) -> None:
+        """Cache the restricted-half sign for the path's side and show its shading."""
+        self._restricted_sign = _RESTRICTED_SIGNS[self.path.side] if self.path else 0.0
+        self._set_restricted_visibility()
+    
     def redraw(self) -> None:
-        """Redraw the entire canvas."""
-        self.canvas.delete("all")
-        self._draw_field()
-        self._draw_restricted_zone()
-        self._draw_path()
-        self._draw_waypoints()
+        """
+        Bring the canvas up to date with the path.
+        
+        Path and waypoint items are kept between redraws and only moved or
+        restyled where they changed; they are rebuilt when the path or its
+        waypoint count changes. The field grid is drawn once.
+        
+        Skipped while the canvas isn't viewable (e.g. window minimized);
+        the canvas is brought up to date when it is mapped again.
+        """
+        if not self.canvas.winfo_viewable():
+            self._needs_redraw = True
+            return
+        self._needs_redraw = False
+        
+        waypoints = self.path.waypoints if self.path is not None else []
+        if self.path is not self._drawn_path or len(waypoints) != len(self._waypoint_items):
+            self._rebuild_path_items()
+        else:
+            xs, ys = self.coords.field_to_canvas_batch(
+                [wp.x for wp in waypoints], [wp.y for wp in waypoints]
+            )
+            old_xs, old_ys = self._wp_canvas_xs, self._wp_canvas_ys
+            self._wp_canvas_xs, self._wp_canvas_ys = xs, ys
+            
+            # Segments touching a moved waypoint
+            segments: set[int] = set()
+            for i, wp in enumerate(waypoints):
+                self._sync_waypoint(i, wp, old_xs[i], old_ys[i])
+                if xs[i] != old_xs[i] or ys[i] != old_ys[i]:
+                    segments.update((i - 1, i))
+            
+            for i in segments:
+                if 0 <= i < len(self._segment_items):
+                    self._place_segment(i)
+        
+        self._draw_heading()
+    
+    def _on_map(self, event) -> None:
+        """Redraw if redraws were skipped while hidden."""
+        if self._needs_redraw:
+            self.redraw()
+    
+    def _update_waypoint_visual(self, index: int) -> None:
+        """Move one waypoint's items and its two adjacent path segments."""
+        if self.path is not self._drawn_path or len(self.path.waypoints) != len(self._waypoint_items):
+            self.redraw()
+            return
+        
+        wp = self.path.waypoints[index]
+        x, y = self.coords.field_to_canvas(wp.x, wp.y)
+        old_x = self._wp_canvas_xs[index]
+        old_y = self._wp_canvas_ys[index]
+        self._wp_canvas_xs[index] = x
+        self._wp_canvas_ys[index] = y
+        
+        self._sync_waypoint(index, wp, old_x, old_y)
+        if index > 0:
+            self._place_segment(index - 1)
+        if index < len(self._segment_items):
+            self._place_segment(index)
+        
+        if index == self.selected_index:
+            self._draw_heading()
     
     def _draw_field(self) -> None:
         """Draw the field grid."""
-        # Draw tiles (6x6 grid)
+        # Draw tiles (6x6 grid). Each color is one multi-point line that
+        # snakes through its grid lines; the connecting runs lie along the
+        # field edges, which are grid lines (or under the border) anyway.
         tile_pixels = CANVAS_SIZE / 6
         
-        for i in range(7):
-            x = i * tile_pixels
-            color = COLOR_GRID_CENTER if i == 3 else COLOR_GRID
-            width = 2 if i == 3 else 1
-            self.canvas.create_line(x, 0, x, CANVAS_SIZE, fill=color, width=width)
-            self.canvas.create_line(0, x, CANVAS_SIZE, x, fill=color, width=width)
+        grid_points = []
+        lines = [i * tile_pixels for i in range(7) if i != 3]
+        for k, x in enumerate(lines):
+            y1, y2 = (0, CANVAS_SIZE) if k % 2 == 0 else (CANVAS_SIZE, 0)
+            grid_points.extend((x, y1, x, y2))
+        for k, y in enumerate(lines):
+            x1, x2 = (CANVAS_SIZE, 0) if k % 2 == 0 else (0, CANVAS_SIZE)
+            grid_points.extend((x1, y, x2, y))
+        self.canvas.create_line(*grid_points, fill=COLOR_GRID, width=1, tags="field")
+        
+        center = 3 * tile_pixels
+        self.canvas.create_line(
+            center, 0, center, CANVAS_SIZE,
+            0, CANVAS_SIZE, 0, center, CANVAS_SIZE, center,
+            fill=COLOR_GRID_CENTER, width=2, tags="field"
+        )
         
         # Draw autonomous line (horizontal at y=0, which is center)
         center_y = CANVAS_SIZE / 2
         self.canvas.create_line(
             0, center_y, CANVAS_SIZE, center_y,
-            fill=COLOR_AUTON_LINE, width=2, dash=(10, 5)
+            fill=COLOR_AUTON_LINE, width=2, dash=(10, 5), tags="field"
         )
         
         # Draw field border
         self.canvas.create_rectangle(
             1, 1, CANVAS_SIZE - 1, CANVAS_SIZE - 1,
-            outline="#666666", width=2
+            outline="#666666", width=2, tags="field"
         )
     
-    def _draw_restricted_zone(self) -> None:
-        """Draw shading for restricted side based on path settings."""
-        if self.path is None:
-            return
+    def _create_restricted_zones(self) -> None:
+        """Create the (hidden) shading for each side's restricted half."""
+        center_x, _ = self.coords.field_to_canvas(0, 0)
         
-        if self.path.side == Side.LEFT:
-            # Shade right side (x > 0)
-            x_start, _ = self.coords.field_to_canvas(0, 0)
-            self.canvas.create_rectangle(
-                x_start, 0, CANVAS_SIZE, CANVAS_SIZE,
-                fill=COLOR_RESTRICTED, stipple="gray25", outline=""
-            )
-        elif self.path.side == Side.RIGHT:
-            # Shade left side (x < 0)
-            x_end, _ = self.coords.field_to_canvas(0, 0)
-            self.canvas.create_rectangle(
-                0, 0, x_end, CANVAS_SIZE,
-                fill=COLOR_RESTRICTED, stipple="gray25", outline=""
-            )
+        self._restricted_items = {
+            # Left side: shade right half (x > 0)
+            Side.LEFT: self.canvas.create_rectangle(
+                center_x, 0, CANVAS_SIZE, CANVAS_SIZE,
+                fill=COLOR_RESTRICTED, stipple="gray25", outline="",
+                state=tk.HIDDEN, tags="restricted"
+            ),
+            # Right side: shade left half (x < 0)
+            Side.RIGHT: self.canvas.create_rectangle(
+                0, 0, center_x, CANVAS_SIZE,
+                fill=COLOR_RESTRICTED, stipple="gray25", outline="",
+                state=tk.HIDDEN, tags="restricted"
+            ),
+        }
         # Side.FULL = no restriction
+        self._shown_restricted_side: Optional[Side] = None
     
-    def _draw_path(self) -> None:
-        """Draw path lines between waypoints."""
-        if self.path is None or len(self.path.waypoints) < 2:
+    def _set_restricted_visibility(self) -> None:
+        """Show the shading for the current path's side, hiding the other."""
+        side = self.path.side if self.path is not None else None
+        if side == self._shown_restricted_side:
             return
         
-        waypoints = self.path.waypoints
-        
-        for i in range(len(waypoints) - 1):
-            wp1 = waypoints[i]
-            wp2 = waypoints[i + 1]
-            
-            x1, y1 = self.coords.field_to_canvas(wp1.x, wp1.y)
-            x2, y2 = self.coords.field_to_canvas(wp2.x, wp2.y)
-            
-            # Draw line
-            self.canvas.create_line(
-                x1, y1, x2, y2,
-                fill=COLOR_PATH_LINE, width=2, arrow=tk.LAST
-            )
+        for item_side, item in self._restricted_items.items():
+            self.canvas.itemconfigure(item, state=tk.NORMAL if item_side == side else tk.HIDDEN)
+        self._shown_restricted_side = side
     
-    def _draw_waypoints(self) -> None:
-        """Draw all waypoints."""
+    def _rebuild_path_items(self) -> None:
+        """Delete and recreate all path and waypoint items."""
+        self.canvas.delete("path", "waypoint")
+        self._drawn_path = self.path
+        self._segment_items.clear()
+        self._waypoint_items.clear()
+        self._waypoint_styles.clear()
+        self._wp_canvas_xs = []
+        self._wp_canvas_ys = []
+        
         if self.path is None:
             return
         
-        for i, wp in enumerate(self.path.waypoints):
-            self._draw_waypoint(wp, i)
-    
-    def _draw_waypoint(self, wp: Waypoint, index: int) -> None:
-        """Draw a single waypoint."""
-        x, y = self.coords.field_to_canvas(wp.x, wp.y)
+        waypoints = self.path.waypoints
+        xs, ys = self.coords.field_to_canvas_batch(
+            [wp.x for wp in waypoints], [wp.y for wp in waypoints]
+        )
+        self._wp_canvas_xs, self._wp_canvas_ys = xs, ys
         
-        is_start = (wp.motion_type == MotionType.START)
-        is_selected = (index == self.selected_index)
+        # Path lines between waypoints. Each segment is its own item because
+        # Tk only draws arrowheads at the ends of a line, and every segment
+        # shows its direction; drags only move the two segments they touch.
+        for i in range(len(waypoints) - 1):
+            self._segment_items.append(self.canvas.create_line(
+                xs[i], ys[i], xs[i + 1], ys[i + 1],
+                fill=COLOR_PATH_LINE, width=2, arrow=tk.LAST, tags="path"
+            ))
         
-        # Determine radius and color
-        if is_selected:
-            radius = SELECTED_RADIUS
-            color = COLOR_WAYPOINT_SELECTED
-        elif is_start:
-            radius = START_WAYPOINT_RADIUS
-            color = COLOR_WAYPOINT_START
-        else:
-            radius = WAYPOINT_RADIUS
-            color = COLOR_WAYPOINT
+        # Waypoints on top
+        for i, wp in enumerate(waypoints):
+            self._draw_waypoint(wp, i, xs[i], ys[i])
+    
+    def _place_segment(self, index: int) -> None:
+        """Move a path segment to its waypoints' canvas positions."""
+        xs, ys = self._wp_canvas_xs, self._wp_canvas_ys
+        self.canvas.coords(
+            self._segment_items[index],
+            xs[index], ys[index], xs[index + 1], ys[index + 1]
+        )
+    
+    def _draw_waypoint(self, wp: Waypoint, index: int, x: float, y: float) -> None:
+        """Draw a single waypoint at canvas position (x, y)."""
+        style = _style_for(index == self.selected_index, wp.motion_type)
+        radius, color, text_color = style
+        
+        # Both items share a per-waypoint tag so they can move together
+        tags = ("waypoint", f"wp{index}")
         
         # Draw circle
-        self.canvas.create_oval(
+        oval = self.canvas.create_oval(
             x - radius, y - radius,
             x + radius, y + radius,
-            fill=color, outline="#FFFFFF", width=2
+            fill=color, outline="#FFFFFF", width=2, tags=tags
         )
         
         # Draw index number
-        self.canvas.create_text(
+        text = self.canvas.create_text(
             x, y,
             text=str(index + 1),
-            fill="#000000" if is_start else "#FFFFFF",
-            font=("Arial", 9, "bold")
+            fill=text_color,
+            font=("Arial", 9, "bold"),
+            tags=tags
         )
         
-        # Draw heading arrow for selected waypoint
-        if is_selected and wp.heading is not None:
-            self._draw_heading_arrow(x, y, wp.heading, radius + 5)
+        self._waypoint_items.append((oval, text))
+        self._waypoint_styles.append(style)
+    
+    def _sync_waypoint(self, index: int, wp: Waypoint, old_x: float, old_y: float) -> None:
+        """
+        Bring a waypoint's items up to date with its style and its canvas
+        position (previously drawn at old_x, old_y).
+        """
+        style = _style_for(index == self.selected_index, wp.motion_type)
+        x = self._wp_canvas_xs[index]
+        y = self._wp_canvas_ys[index]
+        
+        if style != self._waypoint_styles[index]:
+            oval, text = self._waypoint_items[index]
+            radius, color, text_color = style
+            self.canvas.itemconfig(oval, fill=color)
+            self.canvas.itemconfig(text, fill=text_color)
+            self.canvas.coords(oval, x - radius, y - radius, x + radius, y + radius)
+            self.canvas.coords(text, x, y)
+            self._waypoint_styles[index] = style
+        elif x != old_x or y != old_y:
+            # Shift circle and label together in one call
+            self.canvas.move(f"wp{index}", x - old_x, y - old_y)
+    
+    def _draw_heading(self) -> None:
+        """Draw the heading arrow for the selected waypoint, if it has one."""
+        self.canvas.delete("heading")
+        
+        index = self.selected_index
+        if index is None or not 0 <= index < len(self._waypoint_styles):
+            return
+        
+        wp = self.path.waypoints[index]
+        if wp.heading is not None:
+            radius = self._waypoint_styles[index][0]
+            self._draw_heading_arrow(
+                self._wp_canvas_xs[index], self._wp_canvas_ys[index],
+                wp.heading, radius + 5
+            )
     
     def _draw_heading_arrow(self, x: float, y: float, heading: float, length: float) -> None:
         """Draw an arrow indicating heading direction."""
-        import math
-        # Convert heading to canvas angle (0° = up = -90° in canvas coords)
-        angle_rad = math.radians(90 - heading)
+        dx, dy = _heading_vector(heading)
         
-        end_x = x + length * math.cos(angle_rad)
-        end_y = y - length * math.sin(angle_rad)
+        end_x = x + length * dx
+        end_y = y + length * dy
         
         self.canvas.create_line(
             x, y, end_x, end_y,
-            fill=COLOR_HEADING_ARROW, width=2, arrow=tk.LAST
+            fill=COLOR_HEADING_ARROW, width=2, arrow=tk.LAST, tags="heading"
         )
     
     def _find_waypoint_at(self, canvas_x: float, canvas_y: float) -> Optional[int]:
@@ -231,13 +421,16 @@ class FieldCanvas(ttk.Frame):
         if self.path is None:
             return None
         
-        for i, wp in enumerate(self.path.waypoints):
-            wx, wy = self.coords.field_to_canvas(wp.x, wp.y)
-            dist = ((canvas_x - wx)**2 + (canvas_y - wy)**2)**0.5
-            if dist <= HIT_RADIUS:
-                return i
+        # Hit-test against the drawn positions; bring them up to date first
+        # if the path changed without a redraw
+        if self.path is not self._drawn_path or len(self.path.waypoints) != len(self._waypoint_items):
+            self.redraw()
         
-        return None
+        return first_point_within(
+            PointArray(self._wp_canvas_xs, self._wp_canvas_ys),
+            Point(canvas_x, canvas_y),
+            HIT_RADIUS
+        )
     
     def _on_click(self, event) -> None:
         """Handle left click."""
@@ -249,6 +442,7 @@ class FieldCanvas(ttk.Frame):
             self.selected_index = index
             self._dragging = True
             self._drag_index = index
+            self._last_flushed_xy = None
             
             if self.on_waypoint_selected:
                 self.on_waypoint_selected(index)
@@ -259,7 +453,7 @@ class FieldCanvas(ttk.Frame):
             field_x, field_y = self.coords.canvas_to_field(event.x, event.y)
             
             # Check if position is valid for current side
-            if self.path and not self.path.is_valid_position(field_x, field_y):
+            if field_x * self._restricted_sign > 0:
                 return  # Don't add in restricted zone
             
             if self.on_waypoint_added:
@@ -277,31 +471,64 @@ class FieldCanvas(ttk.Frame):
         field_y = max(-FIELD_HALF_SIZE, min(FIELD_HALF_SIZE, field_y))
         
         # Check side restriction
-        if self.path and not self.path.is_valid_position(field_x, field_y):
+        if field_x * self._restricted_sign > 0:
+            return
+        
+        # Apply once per idle cycle, however many motion events arrive
+        self._pending_drag = (field_x, field_y)
+        if self._drag_redraw_id is None:
+            self._drag_redraw_id = self.canvas.after_idle(self._flush_drag)
+    
+    def _flush_drag(self) -> None:
+        """Move the dragged waypoint to the latest pending drag position."""
+        self._drag_redraw_id = None
+        pending = self._pending_drag
+        self._pending_drag = None
+        
+        if pending is None or self._drag_index is None:
             return
         
         # Update waypoint position
         if self.path and 0 <= self._drag_index < len(self.path.waypoints):
-            self.path.waypoints[self._drag_index].x = field_x
-            self.path.waypoints[self._drag_index].y = field_y
-            self.redraw()
+            self.path.waypoints[self._drag_index].x = pending[0]
+            self.path.waypoints[self._drag_index].y = pending[1]
+            self._last_flushed_xy = pending
+            self._update_waypoint_visual(self._drag_index)
     
     def _on_release(self, event) -> None:
         """Handle mouse button release."""
-        if self._dragging and self._drag_index is not None:
-            field_x, field_y = self.coords.canvas_to_field(event.x, event.y)
-            field_x = max(-FIELD_HALF_SIZE, min(FIELD_HALF_SIZE, field_x))
-            field_y = max(-FIELD_HALF_SIZE, min(FIELD_HALF_SIZE, field_y))
-            
-            if self.on_waypoint_moved:
-                self.on_waypoint_moved(self._drag_index, field_x, field_y)
+        # Apply any drag motion still waiting for idle
+        if self._drag_redraw_id is not None:
+            self.canvas.after_cancel(self._drag_redraw_id)
+            self._flush_drag()
+        
+        # Report where the waypoint actually ended up; a click without a
+        # drag moved nothing
+        if (self._dragging and self._drag_index is not None
+                and self._last_flushed_xy is not None and self.on_waypoint_moved):
+            self.on_waypoint_moved(self._drag_index, *self._last_flushed_xy)
         
         self._dragging = False
         self._drag_index = None
+        self._last_flushed_xy = None
     
     def _on_mouse_move(self, event) -> None:
         """Handle mouse movement for coordinate display."""
-        field_x, field_y = self.coords.canvas_to_field(event.x, event.y)
+        # Report the latest position once per interval, not per event
+        self._pending_move = (event.x, event.y)
+        if self._move_after_id is None:
+            self._move_after_id = self.canvas.after(MOUSE_MOVE_INTERVAL_MS, self._flush_mouse_move)
+    
+    def _flush_mouse_move(self) -> None:
+        """Report the latest pending mouse position."""
+        self._move_after_id = None
+        pending = self._pending_move
+        self._pending_move = None
+        
+        if pending is None:
+            return
+        
+        field_x, field_y = self.coords.canvas_to_field(*pending)
         
         if self.on_mouse_move:
             self.on_mouse_move(field_x, field_y)
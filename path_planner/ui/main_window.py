@@ -6,7 +6,10 @@ Assembles all UI components and manages their interactions.
 
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
+import copy
 import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Optional
 
 from path_planner.core.models import Project, Path, Waypoint
@@ -45,6 +48,13 @@ class MainWindow(tk.Tk):
         # Season loader
         self.season_loader = SeasonLoader(base_path)
         
+        # Background season load in progress, if any (see _new_project)
+        self._season_load: Optional[threading.Thread] = None
+        
+        # Code generation runs on a worker; set while an export is pending
+        self._export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="export")
+        self._export_pending = False
+        
         # Undo manager
         self.undo_manager = UndoManager()
         self.undo_manager.on_change(self._update_undo_buttons)
@@ -62,8 +72,9 @@ class MainWindow(tk.Tk):
         # Handle window close
         self.protocol("WM_DELETE_WINDOW", self._on_close)
         
-        # Create new project by default
-        self._new_project("pushback_2026")
+        # Create new project by default, loading its season off the UI
+        # thread so the window shows right away
+        self._new_project("pushback_2026", load_in_background=True)
     
     def _setup_theme(self) -> None:
         """Setup dark theme."""
@@ -139,6 +150,7 @@ class MainWindow(tk.Tk):
         self.path_panel = PathPanel(left_frame)
         self.path_panel.pack(fill=tk.BOTH, expand=True)
         self.path_panel.on_path_changed = self._on_path_changed
+        self.path_panel.on_side_restriction_changed = self._on_side_restriction_changed
         self.path_panel.on_waypoint_selected = self._on_waypoint_selected
         self.path_panel.on_project_modified = self._on_project_modified
         
@@ -161,6 +173,7 @@ class MainWindow(tk.Tk):
         self.waypoint_panel = WaypointPanel(right_frame)
         self.waypoint_panel.pack(fill=tk.X, pady=(0, 5))
         self.waypoint_panel.on_waypoint_changed = self._on_waypoint_changed
+        self.waypoint_panel.on_waypoint_previewed = self._on_waypoint_previewed
         
         self.command_panel = CommandPanel(right_frame)
         self.command_panel.pack(fill=tk.BOTH, expand=True)
@@ -181,15 +194,29 @@ class MainWindow(tk.Tk):
         self.bind("<Control-y>", lambda e: self._on_redo())
         self.bind("<Delete>", lambda e: self._delete_selected())
     
-    def _new_project(self, season: str = "pushback_2026") -> None:
-        """Create a new project."""
+    def _new_project(self, season: str = "pushback_2026", load_in_background: bool = False) -> None:
+        """
+        Create a new project.
+        
+        Args:
+            season: Season folder name
+            load_in_background: Load the season's commands on a worker
+                thread and fill in the command panel when done
+        """
         self.project = create_new_project(season)
         self.current_filepath = None
         self.modified = False
         
         # Load season commands
-        self.season_loader.load_season(season)
-        self.command_panel.set_commands(self.season_loader.commands)
+        if load_in_background:
+            self._load_season_in_background(season)
+        else:
+            self._set_season_loading(None)
+            self.season_loader.load_season(season)
+            self.command_panel.set_commands(
+                self.season_loader.commands,
+                self.season_loader.get_commands_by_category()
+            )
         
         # Update UI
         self.path_panel.set_project(self.project)
@@ -199,6 +226,55 @@ class MainWindow(tk.Tk):
         self.undo_manager.clear()
         self._save_undo_state("New project")
     
+    def _load_season_in_background(self, season: str) -> None:
+        """
+        Load a season into a fresh SeasonLoader on a worker thread.
+        
+        The loader replaces self.season_loader once done, unless another
+        season was loaded in the meantime. It builds its own Command
+        objects, so a discarded result never changes the commands the UI
+        is using.
+        """
+        loader = SeasonLoader(self.base_path)
+        
+        def work() -> None:
+            loader.load_season(season)
+            loader.get_commands_by_category()  # Groups the commands for the panel
+            loader.list_seasons()  # Warms the season list for the season picker
+        
+        thread = threading.Thread(target=work, daemon=True)
+        self._set_season_loading(thread)
+        thread.start()
+        self._poll_season_load(thread, loader)
+    
+    def _poll_season_load(self, thread: threading.Thread, loader: SeasonLoader) -> None:
+        """Install a background-loaded season once its thread finishes."""
+        if thread.is_alive():
+            self.after(20, self._poll_season_load, thread, loader)
+            return
+        
+        if self._season_load is not thread:
+            return  # Superseded by a later load
+        
+        self.season_loader = loader
+        self.command_panel.set_commands(loader.commands, loader.get_commands_by_category())
+        self._set_season_loading(None)
+    
+    def _set_season_loading(self, thread: Optional[threading.Thread]) -> None:
+        """
+        Track the background season load, if any.
+        
+        Export and adding commands stay disabled while a load is running,
+        since self.season_loader doesn't hold the season's commands yet.
+        
+        Args:
+            thread: Thread loading the season, or None once no load is running
+        """
+        self._season_load = thread
+        loading = thread is not None
+        self.command_panel.set_commands_enabled(not loading)
+        self.toolbar.set_export_enabled(not loading and not self._export_pending)
+    
     def _on_new(self) -> None:
         """Handle new project request."""
         if self.modified:
@@ -236,8 +312,12 @@ class MainWindow(tk.Tk):
                 self.modified = False
                 
                 # Load season
+                self._set_season_loading(None)
                 self.season_loader.load_season(project.season)
-                self.command_panel.set_commands(self.season_loader.commands)
+                self.command_panel.set_commands(
+                    self.season_loader.commands,
+                    self.season_loader.get_commands_by_category()
+                )
                 
                 # Update UI
                 self.path_panel.set_project(self.project)
@@ -282,19 +362,59 @@ class MainWindow(tk.Tk):
             return False
     
     def _on_export(self, clipboard: bool = False) -> None:
-        """Handle export request."""
+        """
+        Handle export request.
+        
+        The code is generated on a worker thread from copies of the path
+        and the commands it uses, so edits or season loads made meanwhile
+        can't interfere; the result is shown or copied once ready.
+        """
+        if self._export_pending or self._season_load is not None:
+            return
+        
         path = self.path_panel.get_current_path()
         if path is None:
             messagebox.showwarning("No Path", "No path to export.")
             return
         
-        code = export_path_to_cpp(path, self.season_loader.commands)
+        snapshot = Path.from_dict(path.to_dict())
+        
+        # Season loads reset pooled Commands in place, and generate_code()
+        # caches on the Command, so the worker gets its own copies
+        all_commands = self.season_loader.commands
+        commands = {
+            cmd_id: copy.copy(all_commands[cmd_id])
+            for wp in snapshot.waypoints
+            for cmd_id in wp.commands_after
+            if cmd_id in all_commands
+        }
+        
+        future = self._export_executor.submit(export_path_to_cpp, snapshot, commands)
+        
+        self._export_pending = True
+        self.toolbar.set_export_enabled(False)
+        self._poll_export(future, snapshot.name, clipboard)
+    
+    def _poll_export(self, future: Future, name: str, clipboard: bool) -> None:
+        """Show or copy the generated code once the export finishes."""
+        if not future.done():
+            self.after(10, self._poll_export, future, name, clipboard)
+            return
+        
+        self._export_pending = False
+        self.toolbar.set_export_enabled(self._season_load is None)
+        
+        try:
+            code = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export path: {e}")
+            return
         
         if clipboard:
             copy_to_clipboard(code, self)
             self.status_bar.set_message("Code copied to clipboard!")
         else:
-            ExportDialog(self, code, path.name)
+            ExportDialog(self, code, name)
     
     def _on_undo(self) -> None:
         """Handle undo request."""
@@ -311,7 +431,10 @@ class MainWindow(tk.Tk):
     def _save_undo_state(self, description: str) -> None:
         """Save current state for undo."""
         if self.project:
-            self.undo_manager.save_state(self.project.to_dict(), description)
+            # to_dict() reuses the cached dicts of unchanged paths and
+            # waypoints and never edits them, so snapshots can share them
+            # instead of each holding a full copy
+            self.undo_manager.save_state(self.project.to_dict(), description, copy=False)
     
     def _restore_state(self, state: dict) -> None:
         """Restore project from state dict."""
@@ -319,6 +442,9 @@ class MainWindow(tk.Tk):
         self.project = Project.from_dict(state)
         self.path_panel.set_project(self.project)
         self._on_project_modified()
+        
+        # Settle the whole restored layout in one pass
+        self.update_idletasks()
     
     def _update_undo_buttons(self) -> None:
         """Update undo/redo button states."""
@@ -332,13 +458,17 @@ class MainWindow(tk.Tk):
         self.command_panel.set_waypoint(None)
         self._update_waypoint_count()
     
+    def _on_side_restriction_changed(self, path: Path) -> None:
+        """Handle side change (from path panel)."""
+        self.field_canvas.notify_side_changed()
+    
     def _on_waypoint_added(self, x: float, y: float) -> None:
         """Handle new waypoint added (from canvas)."""
         path = self.path_panel.get_current_path()
         if path:
             index = path.add_waypoint(x, y)
             self.field_canvas.set_selected(index)
-            self.path_panel.refresh_waypoint_list()
+            self.path_panel.append_waypoint_row()
             self.path_panel.select_waypoint(index)
             self._select_waypoint(index)
             self._on_project_modified()
@@ -363,22 +493,44 @@ class MainWindow(tk.Tk):
     
     def _on_waypoint_moved(self, index: int, x: float, y: float) -> None:
         """Handle waypoint drag complete."""
+        self.path_panel.update_waypoint_row(index)
         self._on_project_modified()
         self._save_undo_state("Move waypoint")
     
-    def _on_waypoint_changed(self) -> None:
+    def _on_waypoint_changed(self, index: Optional[int]) -> None:
         """Handle waypoint property change (from waypoint panel)."""
+        self._show_waypoint_edit(index)
+        self._save_undo_state("Edit waypoint")
+    
+    def _on_waypoint_previewed(self, index: Optional[int]) -> None:
+        """Handle a live position edit (from waypoint panel), not yet undoable."""
+        self._show_waypoint_edit(index)
+    
+    def _show_waypoint_edit(self, index: Optional[int]) -> None:
+        """Redraw after the waypoint panel edited waypoint index."""
         self.field_canvas.redraw()
-        self.path_panel.refresh_waypoint_list()
+        # The panel may report an edit after the selection has moved on, so
+        # rewrite the edited waypoint's row rather than the selected one
+        if index is None:
+            self._update_selected_row()
+        else:
+            self.path_panel.update_waypoint_row(index)
         self._on_project_modified()
-        self._save_undo_state("Edit waypoint")
     
     def _on_commands_changed(self) -> None:
         """Handle commands change (from command panel)."""
-        self.path_panel.refresh_waypoint_list()
+        self._update_selected_row()
         self._on_project_modified()
         self._save_undo_state("Edit commands")
     
+    def _update_selected_row(self) -> None:
+        """Rewrite the selected waypoint's row in the path panel."""
+        index = self.field_canvas.selected_index
+        if index is None:
+            self.path_panel.refresh_waypoint_list()
+        else:
+            self.path_panel.update_waypoint_row(index)
+    
     def _on_project_modified(self) -> None:
         """Handle any project modification."""
         self.modified = True
@@ -398,7 +550,7 @@ class MainWindow(tk.Tk):
             path.remove_waypoint(index)
             self.field_canvas.set_selected(None)
             self.field_canvas.redraw()
-            self.path_panel.refresh_waypoint_list()
+            self.path_panel.remove_waypoint_row(index)
             self._select_waypoint(None)
             self._on_project_modified()
             self._save_undo_state("Delete waypoint")
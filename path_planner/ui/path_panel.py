@@ -7,12 +7,26 @@ Displays:
 - Waypoint list
 """
 
+import math
 import tkinter as tk
 from tkinter import ttk, simpledialog
 from typing import Optional, Callable
 from path_planner.core.models import Project, Path, Waypoint, Alliance, Side, MotionType
 
 
+# Rows rendered with real text on each side of the waypoint list viewport;
+# rows further away are left blank until scrolled into view
+VISIBLE_ROW_MARGIN = 32
+
+# Waypoint row templates: marker, number, x, y (and command count)
+_ROW_FORMAT = "{} {}: ({:.1f}, {:.1f})"
+_ROW_FORMAT_COMMANDS = _ROW_FORMAT + " → {} cmd"
+
+# Radio button value -> member; faster than calling the enum
+_ALLIANCE_VALUES = {a.value: a for a in Alliance}
+_SIDE_VALUES = {s.value: s for s in Side}
+
+
 class PathPanel(ttk.Frame):
     """
     Panel for path management and waypoint list.
@@ -23,14 +37,36 @@ class PathPanel(ttk.Frame):
         
         self.project: Optional[Project] = None
         self.current_path_index: int = 0
+        # Path at current_path_index, updated whenever a path is loaded
+        self._current_path: Optional[Path] = None
         
         # Callbacks
         self.on_path_changed: Optional[Callable[[Path], None]] = None
+        self.on_side_restriction_changed: Optional[Callable[[Path], None]] = None
         self.on_waypoint_selected: Optional[Callable[[int], None]] = None
         self.on_project_modified: Optional[Callable[[], None]] = None
         
         self._updating = False
         
+        # Set while a path name dialog is scheduled or open
+        self._dialog_pending = False
+        
+        # Names last given to the path dropdown
+        self._last_path_names: tuple[str, ...] = ()
+        
+        # Text of each waypoint row, and what the listbox currently holds
+        # for it (blank outside the rendered window)
+        self._wp_texts: list[str] = []
+        self._wp_text_cache: list[str] = []
+        
+        # What the rows were last fully refreshed from; cleared whenever a
+        # row is updated on its own
+        self._last_refresh_token: Optional[tuple] = None
+        
+        # Half-open range of rows rendered with real text
+        self._wp_rendered_range: tuple[int, int] = (0, 0)
+        self._render_after_id: Optional[str] = None
+        
         self._create_widgets()
     
     def _create_widgets(self) -> None:
@@ -116,9 +152,12 @@ class PathPanel(ttk.Frame):
         self.waypoint_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.waypoint_listbox.bind("<<ListboxSelect>>", self._on_waypoint_list_select)
         
-        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.waypoint_listbox.yview)
-        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-        self.waypoint_listbox.config(yscrollcommand=scrollbar.set)
+        self.waypoint_scrollbar = ttk.Scrollbar(
+            list_frame, orient=tk.VERTICAL, command=self.waypoint_listbox.yview
+        )
+        self.waypoint_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        # Scrolling, resizing and content changes all report through here
+        self.waypoint_listbox.config(yscrollcommand=self._on_waypoint_yscroll)
         
         # Waypoint control buttons
         wp_btn_frame = ttk.Frame(waypoint_frame)
@@ -134,6 +173,7 @@ class PathPanel(ttk.Frame):
         """Set the current project."""
         self.project = project
         self.current_path_index = 0
+        self._current_path = None
         self._refresh_path_list()
         
         if project and project.paths:
@@ -141,40 +181,104 @@ class PathPanel(ttk.Frame):
     
     def get_current_path(self) -> Optional[Path]:
         """Get the currently selected path."""
-        if self.project and 0 <= self.current_path_index < len(self.project.paths):
-            return self.project.paths[self.current_path_index]
-        return None
+        return self._current_path
     
     def refresh_waypoint_list(self) -> None:
         """Refresh the waypoint listbox."""
         self._refresh_waypoint_list()
     
+    # The targeted row updates below fall back to a full refresh if the
+    # listbox is out of step with the path (e.g. after an edit elsewhere)
+    
+    def update_waypoint_row(self, index: int) -> None:
+        """Rewrite one waypoint's row after it was edited."""
+        path = self.get_current_path()
+        if path is None or not 0 <= index < len(path.waypoints):
+            return
+        
+        if self.waypoint_listbox.size() != len(path.waypoints):
+            self._refresh_waypoint_list()
+            return
+        
+        self._last_refresh_token = None
+        self._relabel_rows(path, index, index)
+    
+    def append_waypoint_row(self) -> None:
+        """Add a row for a waypoint appended to the current path."""
+        path = self.get_current_path()
+        if path is None or not path.waypoints:
+            return
+        
+        index = len(path.waypoints) - 1
+        if self.waypoint_listbox.size() != index:
+            self._refresh_waypoint_list()
+            return
+        
+        self._last_refresh_token = None
+        self._wp_texts.append(self._waypoint_row_text(index, path.waypoints[index]))
+        shown = self._shown_text(index)
+        self.waypoint_listbox.insert(tk.END, shown)
+        self._wp_text_cache.append(shown)
+    
+    def remove_waypoint_row(self, index: int) -> None:
+        """Remove a deleted waypoint's row and renumber the rows after it."""
+        path = self.get_current_path()
+        if path is None:
+            return
+        
+        if self.waypoint_listbox.size() != len(path.waypoints) + 1:
+            self._refresh_waypoint_list()
+            return
+        
+        self._last_refresh_token = None
+        self.waypoint_listbox.delete(index)
+        del self._wp_texts[index]
+        del self._wp_text_cache[index]
+        if index < len(path.waypoints):
+            self._relabel_rows(path, index, len(path.waypoints) - 1)
+    
     def select_waypoint(self, index: Optional[int]) -> None:
         """Select a waypoint in the list."""
-        self.waypoint_listbox.selection_clear(0, tk.END)
-        if index is not None:
+        current = self.waypoint_listbox.curselection()
+        if index is None:
+            if current:
+                self.waypoint_listbox.selection_clear(0, tk.END)
+            return
+        
+        if current != (index,):
+            self.waypoint_listbox.selection_clear(0, tk.END)
             self.waypoint_listbox.selection_set(index)
-            self.waypoint_listbox.see(index)
+        self.waypoint_listbox.see(index)
     
     def _refresh_path_list(self) -> None:
         """Refresh the path dropdown."""
         if self.project is None:
             self.path_combo['values'] = []
+            self._last_path_names = ()
             self.path_var.set("")
             return
         
-        names = [p.name for p in self.project.paths]
-        self.path_combo['values'] = names
+        names = tuple(p.name for p in self.project.paths)
+        # Setting the values rebuilds the dropdown list, so only do it on change
+        if names != self._last_path_names:
+            self.path_combo['values'] = names
+            self._last_path_names = names
         
         if names and self.current_path_index < len(names):
-            self.path_var.set(names[self.current_path_index])
+            name = names[self.current_path_index]
+            if self.path_var.get() != name:
+                self.path_var.set(name)
     
     def _load_path(self, index: int) -> None:
         """Load a path by index."""
         self._updating = True
         
         self.current_path_index = index
-        path = self.get_current_path()
+        if self.project and 0 <= index < len(self.project.paths):
+            path = self.project.paths[index]
+        else:
+            path = None
+        self._current_path = path
         
         if path:
             self.path_var.set(path.name)
@@ -189,22 +293,129 @@ class PathPanel(ttk.Frame):
             self.on_path_changed(path)
     
     def _refresh_waypoint_list(self) -> None:
-        """Refresh the waypoint listbox."""
-        self.waypoint_listbox.delete(0, tk.END)
+        """
+        Refresh the waypoint listbox.
         
+        Only the span of rows whose text changed is rewritten; rows past
+        the end of the new list are deleted and new rows appended, each
+        with a single listbox call.
+        """
         path = self.get_current_path()
         if path is None:
+            self._last_refresh_token = None
+            new_texts = []
+        else:
+            # Skip formatting every row when nothing they show has changed
+            token = (id(path), len(path.waypoints), tuple(
+                (wp.x, wp.y, wp.motion_type, len(wp.commands_after)) for wp in path.waypoints
+            ))
+            if token == self._last_refresh_token:
+                return
+            self._last_refresh_token = token
+            new_texts = self._waypoint_row_texts(path.waypoints, 0, len(path.waypoints))
+        
+        self._wp_texts = new_texts
+        self._wp_rendered_range = self._visible_rows()
+        
+        shown = self._wp_text_cache
+        common = min(len(shown), len(new_texts))
+        
+        if len(shown) > common:
+            self.waypoint_listbox.delete(common, tk.END)
+            del shown[common:]
+        elif len(new_texts) > common:
+            added = [self._shown_text(i) for i in range(common, len(new_texts))]
+            self.waypoint_listbox.insert(tk.END, *added)
+            shown.extend(added)
+        
+        self._sync_rows(0, common)
+    
+    def _waypoint_row_text(self, index: int, wp: Waypoint) -> str:
+        """Get the listbox text for a waypoint."""
+        prefix = "★" if wp.motion_type is MotionType.START else "●"
+        if wp.commands_after:
+            return _ROW_FORMAT_COMMANDS.format(prefix, index + 1, wp.x, wp.y, len(wp.commands_after))
+        return _ROW_FORMAT.format(prefix, index + 1, wp.x, wp.y)
+    
+    def _waypoint_row_texts(self, waypoints: list[Waypoint], lo: int, hi: int) -> list[str]:
+        """Get the listbox text for waypoints[lo:hi]."""
+        start = MotionType.START
+        row_format = _ROW_FORMAT
+        row_format_commands = _ROW_FORMAT_COMMANDS
+        
+        texts = []
+        for number, wp in enumerate(waypoints[lo:hi], lo + 1):
+            prefix = "★" if wp.motion_type is start else "●"
+            commands = wp.commands_after
+            if commands:
+                texts.append(row_format_commands.format(prefix, number, wp.x, wp.y, len(commands)))
+            else:
+                texts.append(row_format.format(prefix, number, wp.x, wp.y))
+        return texts
+    
+    def _relabel_rows(self, path: Path, lo: int, hi: int) -> None:
+        """Rewrite rows lo..hi (inclusive), keeping the selection."""
+        self._wp_texts[lo:hi + 1] = self._waypoint_row_texts(path.waypoints, lo, hi + 1)
+        self._sync_rows(lo, hi + 1)
+    
+    def _shown_text(self, index: int) -> str:
+        """Get what the listbox should hold for a row: its text if rendered."""
+        lo, hi = self._wp_rendered_range
+        return self._wp_texts[index] if lo <= index < hi else ""
+    
+    def _sync_rows(self, lo: int, hi: int) -> None:
+        """Rewrite the rows in [lo, hi) whose listbox text is out of date."""
+        shown = self._wp_text_cache
+        wanted = [self._shown_text(i) for i in range(lo, hi)]
+        
+        changed = [i for i in range(lo, hi) if shown[i] != wanted[i - lo]]
+        if not changed:
             return
         
-        for i, wp in enumerate(path.waypoints):
-            is_start = (wp.motion_type == MotionType.START)
-            prefix = "★" if is_start else "●"
-            text = f"{prefix} {i + 1}: ({wp.x:.1f}, {wp.y:.1f})"
-            
-            if wp.commands_after:
-                text += f" → {len(wp.commands_after)} cmd"
-            
-            self.waypoint_listbox.insert(tk.END, text)
+        # One delete and one insert for the whole span, even if unchanged
+        # rows sit between the changed ones; each listbox call is a Tcl trip
+        first, last = changed[0], changed[-1]
+        self._replace_rows(first, wanted[first - lo:last - lo + 1])
+    
+    def _replace_rows(self, lo: int, texts: list[str]) -> None:
+        """Replace the rows starting at lo with texts, keeping the selection."""
+        hi = lo + len(texts) - 1
+        selected = self.waypoint_listbox.curselection()
+        
+        self.waypoint_listbox.delete(lo, hi)
+        self.waypoint_listbox.insert(lo, *texts)
+        self._wp_text_cache[lo:hi + 1] = texts
+        
+        for i in selected:
+            if lo <= i <= hi:
+                self.waypoint_listbox.selection_set(i)
+    
+    def _visible_rows(self) -> tuple[int, int]:
+        """Get the half-open range of rows in view, widened by the margin."""
+        size = self.waypoint_listbox.size()
+        first, last = self.waypoint_listbox.yview()
+        lo = max(0, int(first * size) - VISIBLE_ROW_MARGIN)
+        hi = math.ceil(last * size) + VISIBLE_ROW_MARGIN
+        return lo, hi
+    
+    def _on_waypoint_yscroll(self, first: str, last: str) -> None:
+        """Update the scrollbar and schedule rendering of the rows in view."""
+        self.waypoint_scrollbar.set(first, last)
+        if self._render_after_id is None:
+            self._render_after_id = self.after_idle(self._render_visible)
+    
+    def _render_visible(self) -> None:
+        """Fill in rows that scrolled into view and blank those that left."""
+        self._render_after_id = None
+        
+        old_lo, old_hi = self._wp_rendered_range
+        lo, hi = self._visible_rows()
+        if (lo, hi) == (old_lo, old_hi):
+            return
+        
+        self._wp_rendered_range = (lo, hi)
+        count = len(self._wp_texts)
+        self._sync_rows(min(lo, old_lo, count), min(max(hi, old_hi), count))
     
     def _on_path_selected(self, event=None) -> None:
         """Handle path selection from dropdown."""
@@ -222,7 +433,7 @@ class PathPanel(ttk.Frame):
         
         path = self.get_current_path()
         if path:
-            path.alliance = Alliance(self.alliance_var.get())
+            path.alliance = _ALLIANCE_VALUES[self.alliance_var.get()]
             self._notify_modified()
     
     def _on_side_change(self) -> None:
@@ -232,12 +443,12 @@ class PathPanel(ttk.Frame):
         
         path = self.get_current_path()
         if path:
-            path.side = Side(self.side_var.get())
+            path.side = _SIDE_VALUES[self.side_var.get()]
             self._notify_modified()
             
-            # Refresh canvas to show restriction
-            if self.on_path_changed:
-                self.on_path_changed(path)
+            # Only the field restriction depends on the side
+            if self.on_side_restriction_changed:
+                self.on_side_restriction_changed(path)
     
     def _on_waypoint_list_select(self, event=None) -> None:
         """Handle waypoint selection from list."""
@@ -245,12 +456,26 @@ class PathPanel(ttk.Frame):
         if selection and self.on_waypoint_selected:
             self.on_waypoint_selected(selection[0])
     
+    # The name dialogs are opened from after_idle so the button's event
+    # handler returns, and pending redraws run, before the dialog grabs input
+    
     def _add_path(self) -> None:
         """Add a new path."""
-        if self.project is None:
+        if self.project is None or self._dialog_pending:
             return
         
-        name = simpledialog.askstring("New Path", "Enter path name:", initialvalue="New Path")
+        self._dialog_pending = True
+        self.after_idle(self._do_add_path)
+    
+    def _do_add_path(self) -> None:
+        """Ask for a name and add the new path."""
+        try:
+            if self.project is None:
+                return
+            name = simpledialog.askstring("New Path", "Enter path name:", initialvalue="New Path")
+        finally:
+            self._dialog_pending = False
+        
         if name:
             self.project.add_path(name)
             self._refresh_path_list()
@@ -270,11 +495,22 @@ class PathPanel(ttk.Frame):
     
     def _rename_path(self) -> None:
         """Rename the current path."""
-        path = self.get_current_path()
-        if path is None:
+        if self.get_current_path() is None or self._dialog_pending:
             return
         
-        name = simpledialog.askstring("Rename Path", "Enter new name:", initialvalue=path.name)
+        self._dialog_pending = True
+        self.after_idle(self._do_rename_path)
+    
+    def _do_rename_path(self) -> None:
+        """Ask for a new name for the current path."""
+        try:
+            path = self.get_current_path()
+            if path is None:
+                return
+            name = simpledialog.askstring("Rename Path", "Enter new name:", initialvalue=path.name)
+        finally:
+            self._dialog_pending = False
+        
         if name:
             path.name = name
             self._refresh_path_list()
@@ -44,9 +44,27 @@ class StatusBar(ttk.Frame):
         # Far right: waypoint count
         self.count_label = ttk.Label(self, text="Waypoints: 0")
         self.count_label.pack(side=tk.RIGHT, padx=5)
+        
+        # Latest coordinates, shown at the next idle
+        self._pending_coord: Optional[tuple[float, float]] = None
+        self._coord_scheduled = False
     
     def set_coordinates(self, x: float, y: float) -> None:
-        """Update coordinate display."""
+        """
+        Update coordinate display.
+        
+        Calls arriving before Tk goes idle are coalesced; only the latest
+        coordinates are shown.
+        """
+        self._pending_coord = (x, y)
+        if not self._coord_scheduled:
+            self._coord_scheduled = True
+            self.after_idle(self._flush_coordinates)
+    
+    def _flush_coordinates(self) -> None:
+        """Show the latest coordinates."""
+        self._coord_scheduled = False
+        x, y = self._pending_coord
         self.coord_label.config(text=f"Mouse: ({x:.1f}\", {y:.1f}\")")
     
     def set_mode(self, mode: str) -> None:
@@ -124,6 +142,12 @@ class Toolbar(ttk.Frame):
         """Enable/disable redo button."""
         self.redo_btn.config(state="normal" if enabled else "disabled")
     
+    def set_export_enabled(self, enabled: bool) -> None:
+        """Enable/disable export and copy buttons."""
+        state = "normal" if enabled else "disabled"
+        self.export_btn.config(state=state)
+        self.copy_btn.config(state=state)
+    
     def _on_new(self) -> None:
         if self.on_new:
             self.on_new()
@@ -14,6 +14,14 @@ from typing import Optional, Callable
 from path_planner.core.models import Waypoint, MotionType, HeadingMode
 
 
+# Edits to the position entries are previewed once typing pauses this long
+POSITION_ENTRY_DELAY_MS = 150
+
+# Widget value -> member; faster than calling the enum
+_HEADING_MODE_VALUES = {m.value: m for m in HeadingMode}
+_MOTION_TYPE_VALUES = {m.value: m for m in MotionType}
+
+
 class WaypointPanel(ttk.LabelFrame):
     """
     Panel for editing waypoint properties.
@@ -25,17 +33,39 @@ class WaypointPanel(ttk.LabelFrame):
         self.waypoint: Optional[Waypoint] = None
         self.waypoint_index: Optional[int] = None
         
-        # Callback when waypoint is modified
-        self.on_waypoint_changed: Optional[Callable[[], None]] = None
+        # Callback when waypoint is modified, given the edited waypoint's index
+        self.on_waypoint_changed: Optional[Callable[[Optional[int]], None]] = None
+        # Callback when typed position values are previewed; the edit is
+        # reported through on_waypoint_changed once committed
+        self.on_waypoint_previewed: Optional[Callable[[Optional[int]], None]] = None
         
         # Prevent recursive updates
         self._updating = False
         
-        self._create_widgets()
-        self._set_enabled(False)
+        # Set while a change notification is waiting for the next idle
+        self._pending_notify = False
+        
+        # Pending after() that previews typed position values, and whether
+        # a previewed position is still waiting for Return/FocusOut
+        self._pos_after: Optional[str] = None
+        self._position_uncommitted = False
+        
+        # The editing widgets are created when a waypoint is first shown;
+        # until then the panel only holds the info label
+        self._built = False
+        
+        # Last states given to the inputs, so unchanged ones aren't reconfigured
+        self._enabled_state: Optional[bool] = None
+        self._heading_entry_state: Optional[str] = None
+        
+        self.info_label = ttk.Label(self, text="Click a waypoint to edit", foreground="gray")
+        self.info_label.pack(pady=10)
     
     def _create_widgets(self) -> None:
-        """Create all widgets."""
+        """Create all editing widgets."""
+        # Keep the info label below the new widgets
+        self.info_label.pack_forget()
+        
         # Position frame
         pos_frame = ttk.Frame(self)
         pos_frame.pack(fill=tk.X, padx=5, pady=5)
@@ -43,14 +73,16 @@ class WaypointPanel(ttk.LabelFrame):
         ttk.Label(pos_frame, text="Position:").pack(side=tk.LEFT)
         
         ttk.Label(pos_frame, text="X").pack(side=tk.LEFT, padx=(10, 2))
-        self.x_var = tk.StringVar()
+        self.x_var = tk.DoubleVar()
+        self.x_var.trace_add("write", self._on_position_edit)
         self.x_entry = ttk.Entry(pos_frame, textvariable=self.x_var, width=8)
         self.x_entry.pack(side=tk.LEFT)
         self.x_entry.bind("<Return>", self._on_position_change)
         self.x_entry.bind("<FocusOut>", self._on_position_change)
         
         ttk.Label(pos_frame, text="Y").pack(side=tk.LEFT, padx=(10, 2))
-        self.y_var = tk.StringVar()
+        self.y_var = tk.DoubleVar()
+        self.y_var.trace_add("write", self._on_position_edit)
         self.y_entry = ttk.Entry(pos_frame, textvariable=self.y_var, width=8)
         self.y_entry.pack(side=tk.LEFT)
         self.y_entry.bind("<Return>", self._on_position_change)
@@ -75,7 +107,7 @@ class WaypointPanel(ttk.LabelFrame):
         )
         self.heading_manual_rb.pack(side=tk.LEFT, padx=5)
         
-        self.heading_var = tk.StringVar()
+        self.heading_var = tk.DoubleVar()
         self.heading_entry = ttk.Entry(heading_frame, textvariable=self.heading_var, width=8)
         self.heading_entry.pack(side=tk.LEFT, padx=5)
         self.heading_entry.bind("<Return>", self._on_heading_change)
@@ -123,9 +155,8 @@ class WaypointPanel(ttk.LabelFrame):
         )
         self.conveyor_cb.pack(side=tk.LEFT, padx=5)
         
-        # Info label
-        self.info_label = ttk.Label(self, text="Click a waypoint to edit", foreground="gray")
         self.info_label.pack(pady=10)
+        self._built = True
     
     def set_waypoint(self, waypoint: Optional[Waypoint], index: Optional[int] = None) -> None:
         """
@@ -135,15 +166,25 @@ class WaypointPanel(ttk.LabelFrame):
             waypoint: The waypoint, or None to clear
             index: The waypoint index (for display)
         """
+        # Commit and report edits to the previous waypoint before switching
+        if self._pos_after is not None or self._position_uncommitted:
+            self._on_position_change()
+        if self._pending_notify:
+            self._flush_notify()
+        
         self.waypoint = waypoint
         self.waypoint_index = index
         
+        if waypoint is not None and not self._built:
+            self._create_widgets()
+        
         self._updating = True
         
         if waypoint is None:
-            self._set_enabled(False)
             self.info_label.config(text="Click a waypoint to edit")
-            self._clear_fields()
+            if self._built:
+                self._set_enabled(False)
+                self._clear_fields()
         else:
             self._set_enabled(True)
             self.info_label.config(text=f"Waypoint {index + 1}" if index is not None else "")
@@ -158,16 +199,17 @@ class WaypointPanel(ttk.LabelFrame):
         
         wp = self.waypoint
         
-        self.x_var.set(f"{wp.x:.1f}")
-        self.y_var.set(f"{wp.y:.1f}")
+        # Rounded floats display the same as the old "%.1f" text
+        self.x_var.set(round(wp.x, 1))
+        self.y_var.set(round(wp.y, 1))
         
         self.heading_mode_var.set(wp.heading_mode.value)
         if wp.heading is not None:
-            self.heading_var.set(f"{wp.heading:.1f}")
+            self.heading_var.set(round(wp.heading, 1))
         else:
             self.heading_var.set("")
         
-        self.heading_entry.config(state="normal" if wp.heading_mode == HeadingMode.MANUAL else "disabled")
+        self._set_heading_entry_state("normal" if wp.heading_mode == HeadingMode.MANUAL else "disabled")
         
         self.motion_var.set(wp.motion_type.value)
         
@@ -192,49 +234,98 @@ class WaypointPanel(ttk.LabelFrame):
     
     def _set_enabled(self, enabled: bool) -> None:
         """Enable or disable all inputs."""
+        if self._enabled_state == enabled:
+            return
+        self._enabled_state = enabled
+        
         state = "normal" if enabled else "disabled"
         
         self.x_entry.config(state=state)
         self.y_entry.config(state=state)
         self.heading_auto_rb.config(state=state)
         self.heading_manual_rb.config(state=state)
-        self.heading_entry.config(state=state if enabled and self.heading_mode_var.get() == "manual" else "disabled")
+        self._set_heading_entry_state(state if enabled and self.heading_mode_var.get() == "manual" else "disabled")
         self.motion_combo.config(state="readonly" if enabled else "disabled")
         self.reverse_cb.config(state=state)
         self.intaking_cb.config(state=state)
         self.conveyor_cb.config(state=state)
     
+    def _set_heading_entry_state(self, state: str) -> None:
+        """Set the heading entry's state if it differs from the current one."""
+        if self._heading_entry_state != state:
+            self._heading_entry_state = state
+            self.heading_entry.config(state=state)
+    
+    def _on_position_edit(self, *args) -> None:
+        """Preview edited position values once typing pauses."""
+        if self._updating:
+            return  # Set by _load_waypoint or _clear_fields, not typed
+        
+        if self._pos_after is not None:
+            self.after_cancel(self._pos_after)
+        self._pos_after = self.after(POSITION_ENTRY_DELAY_MS, self._preview_position)
+    
+    def _preview_position(self) -> None:
+        """Apply typed position values without committing the edit."""
+        self._pos_after = None
+        
+        if self._apply_position():
+            self._position_uncommitted = True
+            if self.on_waypoint_previewed:
+                self.on_waypoint_previewed(self.waypoint_index)
+    
     def _on_position_change(self, event=None) -> None:
-        """Handle position change."""
+        """Handle position change (Return or FocusOut commits the edit)."""
+        if self._pos_after is not None:
+            self.after_cancel(self._pos_after)
+            self._pos_after = None
+        
+        if self._apply_position() or self._position_uncommitted:
+            self._position_uncommitted = False
+            self._notify_change()
+    
+    def _apply_position(self) -> bool:
+        """
+        Copy the position entries to the waypoint.
+        
+        Returns:
+            True if the waypoint moved
+        """
         if self._updating or self.waypoint is None:
-            return
+            return False
         
         try:
-            x = float(self.x_var.get())
-            y = float(self.y_var.get())
-            self.waypoint.x = x
-            self.waypoint.y = y
-            self._notify_change()
-        except ValueError:
-            pass  # Invalid input, ignore
+            x = self.x_var.get()
+            y = self.y_var.get()
+        except tk.TclError:
+            return False  # Invalid input, ignore
+        
+        # FocusOut fires whenever the user tabs through; skip unedited fields
+        wp = self.waypoint
+        if (x == wp.x and y == wp.y) or (x == round(wp.x, 1) and y == round(wp.y, 1)):
+            return False
+        
+        wp.x = x
+        wp.y = y
+        return True
     
     def _on_heading_mode_change(self) -> None:
         """Handle heading mode change."""
         if self._updating or self.waypoint is None:
             return
         
-        mode = HeadingMode(self.heading_mode_var.get())
+        mode = _HEADING_MODE_VALUES[self.heading_mode_var.get()]
         self.waypoint.heading_mode = mode
         
         if mode == HeadingMode.AUTO:
             self.waypoint.heading = None
-            self.heading_entry.config(state="disabled")
+            self._set_heading_entry_state("disabled")
             self.heading_var.set("")
         else:
-            self.heading_entry.config(state="normal")
+            self._set_heading_entry_state("normal")
             if self.waypoint.heading is None:
                 self.waypoint.heading = 0.0
-                self.heading_var.set("0.0")
+                self.heading_var.set(0.0)
         
         self._notify_change()
     
@@ -244,23 +335,22 @@ class WaypointPanel(ttk.LabelFrame):
             return
         
         try:
-            heading = float(self.heading_var.get())
-            self.waypoint.heading = heading
-            self._notify_change()
-        except ValueError:
-            pass
+            heading = self.heading_var.get()
+        except tk.TclError:
+            return  # Blank or invalid input, ignore
+        
+        self.waypoint.heading = heading
+        self._notify_change()
     
     def _on_motion_change(self, event=None) -> None:
         """Handle motion type change."""
         if self._updating or self.waypoint is None:
             return
         
-        try:
-            motion = MotionType(self.motion_var.get())
+        motion = _MOTION_TYPE_VALUES.get(self.motion_var.get())
+        if motion is not None:
             self.waypoint.motion_type = motion
             self._notify_change()
-        except ValueError:
-            pass
     
     def _on_param_change(self) -> None:
         """Handle parameter checkbox change."""
@@ -273,6 +363,26 @@ class WaypointPanel(ttk.LabelFrame):
         self._notify_change()
     
     def _notify_change(self) -> None:
-        """Notify that waypoint was changed."""
+        """
+        Notify that waypoint was changed.
+        
+        Changes made in the same event-loop pass (e.g. committing X and Y
+        one after the other) are reported once, when Tk next goes idle.
+        """
+        if not self._pending_notify:
+            self._pending_notify = True
+            self.after_idle(self._flush_notify)
+    
+    def _flush_notify(self) -> None:
+        """
+        Report a pending change, if it wasn't already reported.
+        
+        set_waypoint() flushes before switching, so waypoint_index is still
+        that of the edited waypoint, even if the selection elsewhere moved.
+        """
+        if not self._pending_notify:
+            return
+        
+        self._pending_notify = False
         if self.on_waypoint_changed:
-            self.on_waypoint_changed()
\ No newline at end of file
+            self.on_waypoint_changed(self.waypoint_index)
\ No newline at end of file
@@ -0,0 +1,43 @@
+"""
+Tests for path_planner.core.commands.
+"""
+
+import unittest
+
+from path_planner.core.commands import Command
+
+
+class GenerateCodeTests(unittest.TestCase):
+    """Tests for Command.generate_code."""
+    
+    def test_no_params_returns_template(self):
+        cmd = Command("wait", "Wait", "pros::delay({ms});")
+        self.assertEqual(cmd.generate_code(), "pros::delay({ms});")
+    
+    def test_fills_placeholders(self):
+        cmd = Command("drive", "Drive", "chassis.move({x}, {y}, {x});")
+        self.assertEqual(cmd.generate_code({"x": 3, "y": 4.5}), "chassis.move(3, 4.5, 3);")
+    
+    def test_non_word_parameter_names(self):
+        cmd = Command("arm", "Arm", "arm.move({arm.pos}, {speed-pct});")
+        code = cmd.generate_code({"arm.pos": 90, "speed-pct": 50})
+        self.assertEqual(code, "arm.move(90, 50);")
+    
+    def test_missing_parameter_left_unsubstituted(self):
+        cmd = Command("arm", "Arm", "arm.move({arm.pos}, {speed});")
+        self.assertEqual(cmd.generate_code({"speed": 50}), "arm.move({arm.pos}, 50);")
+    
+    def test_code_blocks_untouched(self):
+        cmd = Command("loop", "Loop", "for (int i = 0; i < {n}; i++) { step(); }")
+        code = cmd.generate_code({"n": 3})
+        self.assertEqual(code, "for (int i = 0; i < 3; i++) { step(); }")
+    
+    def test_template_change_reparsed(self):
+        cmd = Command("wait", "Wait", "pros::delay({ms});")
+        cmd.generate_code({"ms": 10})
+        cmd.code_template = "wait({ms-total});"
+        self.assertEqual(cmd.generate_code({"ms-total": 20}), "wait(20);")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Tests for path_planner.core.geomtry.
+"""
+
+import math
+import unittest
+
+from path_planner.core.geomtry import (
+    Point, PointArray, curve_lengths, nearest_segment, point_at_length
+)
+
+
+class NearestSegmentTests(unittest.TestCase):
+    """Tests for nearest_segment."""
+    
+    def test_no_segments(self):
+        self.assertIsNone(nearest_segment(Point(0, 0), PointArray([], []), PointArray([], [])))
+    
+    def test_interior_point(self):
+        # Point above the middle of the second segment
+        starts = PointArray([0.0, 0.0], [0.0, 10.0])
+        ends = PointArray([10.0, 10.0], [0.0, 10.0])
+        index, distance = nearest_segment(Point(5.0, 12.0), starts, ends)
+        self.assertEqual(index, 1)
+        self.assertAlmostEqual(distance, 2.0)
+    
+    def test_past_endpoint_clamps_to_end(self):
+        starts = PointArray([0.0], [0.0])
+        ends = PointArray([10.0], [0.0])
+        index, distance = nearest_segment(Point(13.0, 4.0), starts, ends)
+        self.assertEqual(index, 0)
+        self.assertAlmostEqual(distance, 5.0)
+    
+    def test_before_start_clamps_to_start(self):
+        starts = PointArray([0.0], [0.0])
+        ends = PointArray([10.0], [0.0])
+        _, distance = nearest_segment(Point(-3.0, -4.0), starts, ends)
+        self.assertAlmostEqual(distance, 5.0)
+    
+    def test_degenerate_segment(self):
+        # A zero-length segment measures distance to its single point
+        starts = PointArray([2.0, 50.0], [2.0, 50.0])
+        ends = PointArray([2.0, 60.0], [2.0, 50.0])
+        index, distance = nearest_segment(Point(5.0, 6.0), starts, ends)
+        self.assertEqual(index, 0)
+        self.assertAlmostEqual(distance, 5.0)
+    
+    def test_point_on_segment(self):
+        starts = PointArray([0.0], [0.0])
+        ends = PointArray([4.0], [4.0])
+        _, distance = nearest_segment(Point(1.0, 1.0), starts, ends)
+        self.assertAlmostEqual(distance, 0.0)
+        self.assertFalse(math.isnan(distance))
+
+
+class CurveLengthTests(unittest.TestCase):
+    """Tests for curve_lengths and point_at_length."""
+    
+    def setUp(self):
+        # An L: 3 inches along x, then 4 inches up y
+        self.points = PointArray([0.0, 3.0, 3.0], [0.0, 0.0, 4.0])
+        self.cumulative = curve_lengths(self.points)
+    
+    def test_cumulative_lengths(self):
+        self.assertEqual(self.cumulative, [0.0, 3.0, 7.0])
+    
+    def test_empty(self):
+        empty = PointArray([], [])
+        self.assertEqual(curve_lengths(empty), [])
+        self.assertIsNone(point_at_length([], empty, 1.0))
+    
+    def test_single_point(self):
+        single = PointArray([2.0], [5.0])
+        self.assertEqual(curve_lengths(single), [0.0])
+        self.assertEqual(point_at_length([0.0], single, 3.0), Point(2.0, 5.0))
+    
+    def test_zero_or_negative_length(self):
+        self.assertEqual(point_at_length(self.cumulative, self.points, 0.0), Point(0.0, 0.0))
+        self.assertEqual(point_at_length(self.cumulative, self.points, -2.0), Point(0.0, 0.0))
+    
+    def test_past_total_length(self):
+        self.assertEqual(point_at_length(self.cumulative, self.points, 100.0), Point(3.0, 4.0))
+    
+    def test_interior_length(self):
+        p = point_at_length(self.cumulative, self.points, 5.0)
+        self.assertAlmostEqual(p.x, 3.0)
+        self.assertAlmostEqual(p.y, 2.0)
+    
+    def test_length_at_vertex(self):
+        p = point_at_length(self.cumulative, self.points, 3.0)
+        self.assertAlmostEqual(p.x, 3.0)
+        self.assertAlmostEqual(p.y, 0.0)
+
+
+if __name__ == "__main__":
+    unittest.main()